@@ -5,6 +5,7 @@ from pathlib import Path
 
 import bpy
 import bpy.utils.previews
+from bpy.app.handlers import persistent
 from bpy.props import (
     BoolProperty,
     CollectionProperty,
@@ -35,8 +36,9 @@ from .ui import (
 )
 from .xv2.EAN.exporter import export_cam_ean, export_ean
 from .xv2.EAN.importer import import_cam_ean, import_ean_animations
+from .xv2.EMB import invalidate_emb_cache
 from .xv2.EMD.exporter import export_selected
-from .xv2.EMD.importer import import_emd
+from .xv2.EMD.importer import import_emd, invalidate_dyt_line_cache
 from .xv2.ESK.exporter import export_esk
 from .xv2.ESK.importer import import_esk
 from .xv2.FMP.exporter import export_map
@@ -805,13 +807,26 @@ class EXPORT_OT_ean(Operator, ExportHelper):
         description="Add a rest pose keyframe at frame 0 for bones with no keyframes",
         default=False,
     )
+    full_precision_keys: BoolProperty(  # type: ignore
+        name="32-bit Keyframes",
+        description=(
+            "Store keyframe values as 32-bit floats instead of the source EAN's precision "
+            "(16-bit half floats when there is no source)"
+        ),
+        default=False,
+    )
 
     def execute(self, context):
         arm = context.object if context.object and context.object.type == "ARMATURE" else None
         if arm is None:
             self.report({"ERROR"}, "Select an armature to export.")
             return {"CANCELLED"}
-        ok, error = export_ean(self.filepath, arm, add_dummy_rest=self.add_dummy_rest_keys)
+        ok, error = export_ean(
+            self.filepath,
+            arm,
+            add_dummy_rest=self.add_dummy_rest_keys,
+            half_floats=False if self.full_precision_keys else None,
+        )
         if ok:
             self.report({"INFO"}, "Exported EAN")
             return {"FINISHED"}
@@ -867,6 +882,13 @@ def _unregister_class(cls):
         bpy.utils.unregister_class(cls)
 
 
+@persistent
+def _clear_import_caches(_dummy):
+    # Cached EMB buffers and image references belong to the previous blend file.
+    invalidate_emb_cache()
+    invalidate_dyt_line_cache()
+
+
 def register():
     global _custom_icons, _xv2_assets_icon_id, _entry_icon_ids
 
@@ -901,6 +923,8 @@ def register():
 
     bpy.types.TOPBAR_MT_file_import.append(menu_func)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
+    if _clear_import_caches not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_clear_import_caches)
 
 
 def unregister():
@@ -908,6 +932,10 @@ def unregister():
 
     bpy.types.TOPBAR_MT_file_import.remove(menu_func)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
+    if _clear_import_caches in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_import_caches)
+    invalidate_emb_cache()
+    invalidate_dyt_line_cache()
 
     del bpy.types.Scene.xv2_scd_link
     del bpy.types.Object.emd_texture_samplers
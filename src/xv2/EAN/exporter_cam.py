@@ -1,5 +1,5 @@
 import math
-import secrets
+import os
 import struct
 from collections.abc import Sequence
 from pathlib import Path
@@ -63,7 +63,7 @@ def _pack_half(value: float) -> bytes:
 def _write_skeleton_single_node() -> bytes:
     bone_name = "Node"
     bone_count = 1
-    skeleton_id = secrets.randbits(64) or 1
+    skeleton_id = int.from_bytes(os.urandom(8), "little") or 1
 
     header_size = 36
     index_table_rel = header_size
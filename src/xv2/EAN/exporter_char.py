@@ -1,20 +1,36 @@
-import secrets
+import os
+import re
 import struct
 from collections import defaultdict
+from itertools import accumulate
 from pathlib import Path
 
 import bpy
 import mathutils
+import numpy as np
 
 from ...utils import read_cstring
 from ..ESK.ESK import ESK_Bone, ESK_File
 from .EAN import ComponentType
 
+_POSE_BONE_PREFIX = 'pose.bones["'
+_POSE_BONE_RE = re.compile(r'pose\.bones\["([^"]+)"\]')
+_POSE_CHANNEL_RE = re.compile(r'pose\.bones\["([^"]+)"\]\.(location|rotation_quaternion|scale)$')
+_CHANNEL_TARGETS = {"location": "pos", "rotation_quaternion": "rot", "scale": "scl"}
+_CHANNEL_SIZES = {"pos": 3, "rot": 4, "scl": 3}
 
-def _align16(buf: bytearray) -> None:
-    pad = (-len(buf)) % 16
-    if pad:
-        buf.extend(b"\x00" * pad)
+_SKELETON_HEADER = struct.Struct("<hHIIIIIIQ")
+_BONE_INDICES = struct.Struct("<hhhH")
+_BONE_TRANSFORM = struct.Struct("<12f")
+_U32 = struct.Struct("<I")
+_ANIM_HEADER = struct.Struct("<III")
+_NODE_HEADER = struct.Struct("<hhI")
+_COMP_HEADER = struct.Struct("<BBhIII")
+
+# Plain int component tags for the key emission loop, which compares them per frame.
+_POS_TAG = int(ComponentType.Position)
+_ROT_TAG = int(ComponentType.Rotation)
+_SCL_TAG = int(ComponentType.Scale)
 
 
 def _to_int(value, default: int) -> int:
@@ -49,45 +65,44 @@ def _build_skeleton_bytes(bones: list[ESK_Bone]) -> bytes:
     name_rel = index_rel + bone_count * 8
     string_off = name_rel + bone_count * 4
 
-    strings = bytearray()
-    name_offsets = []
-    for bone in bones:
-        name_offsets.append(len(strings))
-        strings.extend(bone.name.encode("ascii", "ignore") + b"\x00")
+    encoded = [bone.name.encode("ascii", "ignore") for bone in bones]
+    name_offsets = list(accumulate((len(name) + 1 for name in encoded), initial=0))[:-1]
+    strings = b"\x00".join(encoded) + (b"\x00" if encoded else b"")
 
     pad = (-len(strings)) % 4
     skin_rel = string_off + len(strings) + pad
     skeleton_len = skin_rel + 48 * bone_count
 
-    data = bytearray()
-    data.extend(struct.pack("<h", bone_count))
-    data.extend(struct.pack("<H", 0))
-    data.extend(struct.pack("<I", index_rel))
-    data.extend(struct.pack("<I", name_rel))
-    data.extend(struct.pack("<I", skin_rel))
-    data.extend(struct.pack("<I", 0))
-    data.extend(struct.pack("<I", 0))
-    data.extend(struct.pack("<I", skeleton_len))
-    data.extend(struct.pack("<Q", secrets.randbits(64) or 1))
+    buf = bytearray(skeleton_len)
+    _SKELETON_HEADER.pack_into(
+        buf,
+        0,
+        bone_count,
+        0,
+        index_rel,
+        name_rel,
+        skin_rel,
+        0,
+        0,
+        skeleton_len,
+        int.from_bytes(os.urandom(8), "little") or 1,
+    )
 
-    for bone in bones:
-        data.extend(
-            struct.pack("<hhhH", bone.parent_index, bone.child_index, bone.sibling_index, 0)
+    for i, bone in enumerate(bones):
+        _BONE_INDICES.pack_into(
+            buf, index_rel + i * 8, bone.parent_index, bone.child_index, bone.sibling_index, 0
         )
+        _U32.pack_into(buf, name_rel + i * 4, string_off + name_offsets[i])
+    # The padding after the string table is already zeroed by the preallocation.
+    buf[string_off : string_off + len(strings)] = strings
 
-    for offset in name_offsets:
-        data.extend(struct.pack("<I", string_off + offset))
-    data.extend(strings)
-    if pad:
-        data.extend(b"\x00" * pad)
-
-    for bone in bones:
+    for i, bone in enumerate(bones):
         loc, rot, scale = bone.matrix.decompose()
-        data.extend(struct.pack("<4f", loc.x, loc.y, loc.z, 1.0))
-        data.extend(struct.pack("<4f", rot.x, rot.y, rot.z, rot.w))
-        data.extend(struct.pack("<4f", scale.x, scale.y, scale.z, 1.0))
+        _BONE_TRANSFORM.pack_into(
+            buf, skin_rel + i * 48, *loc, 1.0, rot.x, rot.y, rot.z, rot.w, *scale, 1.0
+        )
 
-    return bytes(data)
+    return bytes(buf)
 
 
 def _build_skeleton_from_armature(
@@ -103,15 +118,21 @@ def _build_skeleton_from_armature(
     bones.append(root_bone)
 
     bone_indices = {bone.name: idx + 1 for idx, bone in enumerate(arm_bones)}
+    # Each parent's inverse is computed once and shared by all of its children.
+    inverted_parents: dict[str, mathutils.Matrix] = {}
 
     for idx, bone in enumerate(arm_bones):
-        parent_idx = bone_indices.get(bone.parent.name, 0) if bone.parent else 0
-        local_mat = (
-            bone.parent.matrix_local.inverted() @ bone.matrix_local
-            if bone.parent
-            else bone.matrix_local.copy()
-        )
-        rest_locals[bone.name] = local_mat.copy()
+        parent = bone.parent
+        if parent:
+            parent_idx = bone_indices.get(parent.name, 0)
+            parent_inv = inverted_parents.get(parent.name)
+            if parent_inv is None:
+                parent_inv = inverted_parents[parent.name] = parent.matrix_local.inverted()
+            local_mat = parent_inv @ bone.matrix_local
+        else:
+            parent_idx = 0
+            local_mat = bone.matrix_local.copy()
+        rest_locals[bone.name] = local_mat
         esk_bone = ESK_Bone(bone.name, idx + 1, local_mat, parent_idx, -1, -1)
         bones.append(esk_bone)
 
@@ -122,20 +143,30 @@ def _build_skeleton_from_armature(
     return esk, skeleton_bytes, rest_locals
 
 
+def _action_bone_names(act: bpy.types.Action) -> frozenset[str]:
+    # Computed fresh per export: data paths change on bone renames and action pointers can be
+    # reused after deletion, so nothing is cached across calls.
+    found: set[str] = set()
+    for fc in act.fcurves:
+        data_path = fc.data_path
+        # Object-level and custom property curves are rejected before reaching the regex.
+        if not data_path.startswith(_POSE_BONE_PREFIX):
+            continue
+        match = _POSE_BONE_RE.match(data_path)
+        if match is not None:
+            found.add(match.group(1))
+    return frozenset(found)
+
+
 def _collect_actions(bone_names: set[str]) -> list[bpy.types.Action]:
     actions: list[bpy.types.Action] = []
     seen = set()
     for act in bpy.data.actions:
         if act.name in seen:
             continue
-        for fc in act.fcurves:
-            if not fc.data_path.startswith('pose.bones["'):
-                continue
-            name = fc.data_path.split('"')[1]
-            if name in bone_names:
-                actions.append(act)
-                seen.add(act.name)
-                break
+        if not bone_names.isdisjoint(_action_bone_names(act)):
+            actions.append(act)
+            seen.add(act.name)
     return actions
 
 
@@ -152,11 +183,12 @@ def _load_source_ean_template(path_value: object) -> dict[str, object] | None:
         if len(data) < 32 or data[0:4] != b"#EAN":
             return None
 
-        version = struct.unpack_from("<I", data, 8)[0]
-        i17 = int(data[17])
-        animation_count = struct.unpack_from("<H", data, 18)[0]
-        skeleton_offset = struct.unpack_from("<I", data, 20)[0]
-        animation_table_offset = struct.unpack_from("<I", data, 24)[0]
+        # The 32-byte header is length-checked above, so plain slices are safe here.
+        version = int.from_bytes(data[8:12], "little")
+        i17 = data[17]
+        animation_count = int.from_bytes(data[18:20], "little")
+        skeleton_offset = int.from_bytes(data[20:24], "little")
+        animation_table_offset = int.from_bytes(data[24:28], "little")
         if skeleton_offset <= 0 or animation_table_offset <= skeleton_offset:
             return None
         if animation_table_offset > len(data):
@@ -194,7 +226,7 @@ def _load_source_ean_template(path_value: object) -> dict[str, object] | None:
             rot = mathutils.Quaternion((rw, rx, ry, rz))
             scl = mathutils.Vector((sx, sy, sz)) * sw
             local_mat = mathutils.Matrix.LocRotScale(pos, rot, scl)
-            source_rest_locals[bone_name] = local_mat.copy()
+            source_rest_locals[bone_name] = local_mat
             source_esk.bones.append(
                 ESK_Bone(
                     bone_name,
@@ -295,8 +327,37 @@ def _action_sort_key(action: bpy.types.Action) -> tuple:
     return (2, action.name)
 
 
-def _pack_half(val: float) -> bytes:
-    return struct.pack("<e", val)
+def _rest_trs(
+    rest_local: mathutils.Matrix,
+) -> tuple[mathutils.Matrix, mathutils.Vector, mathutils.Quaternion, mathutils.Vector, bool]:
+    loc, rot, scl = rest_local.decompose()
+    uniform = abs(scl.x - scl.y) + abs(scl.y - scl.z) < 1e-6
+    return rest_local, loc, rot, scl, uniform
+
+
+def _bake_rest_delta(
+    rest: tuple[mathutils.Matrix, mathutils.Vector, mathutils.Quaternion, mathutils.Vector, bool],
+    loc: mathutils.Vector,
+    rot: mathutils.Quaternion,
+    scl: mathutils.Vector,
+) -> tuple[mathutils.Vector, mathutils.Quaternion, mathutils.Vector]:
+    """Return the decomposed ``rest_local @ LocRotScale(loc, rot, scl)``."""
+    rest_local, rest_loc, rest_rot, rest_scl, uniform = rest
+    # Negative scales flip axes in Matrix.decompose(), so only positive ones take a fast path.
+    positive = min(rest_scl) > 0.0 and min(scl) > 0.0
+    if uniform and positive:
+        # With a uniform rest scale the rest rotation and scale commute, so the
+        # composition can be done on the TRS components without building matrices.
+        delta_rot = rest_rot @ rot.normalized()
+        if delta_rot.w < 0.0:
+            # Match the w >= 0 quaternion Matrix.decompose() returns.
+            delta_rot.negate()
+        return rest_loc + rest_rot @ (rest_scl * loc), delta_rot, rest_scl * scl
+    if positive and rot.x == rot.y == rot.z == 0.0 and rot.w:
+        # An unrotated delta only stretches along the rest axes, so the rest rotation is kept
+        # as-is even when the rest scale is non-uniform.
+        return rest_loc + rest_rot @ (rest_scl * loc), rest_rot, rest_scl * scl
+    return (rest_local @ mathutils.Matrix.LocRotScale(loc, rot, scl)).decompose()
 
 
 def _patch_skeleton_rest_transforms(
@@ -320,273 +381,435 @@ def _patch_skeleton_rest_transforms(
         if skin_rel + bone_count * 48 > len(data):
             return skeleton_bytes
 
-        for bone_index in range(bone_count):
-            name_off_rel = struct.unpack_from("<I", data, name_rel + 4 * bone_index)[0]
+        bone_indices: list[int] = []
+        transforms: list[tuple[float, ...]] = []
+        name_offsets = struct.unpack_from(f"<{bone_count}I", data, name_rel)
+        for bone_index, name_off_rel in enumerate(name_offsets):
             if not (0 <= name_off_rel < len(data)):
                 continue
-            bone_name = read_cstring(data, name_off_rel)
-            local_mat = rest_locals.get(bone_name)
+            local_mat = rest_locals.get(read_cstring(data, name_off_rel))
             if local_mat is None:
                 continue
 
             loc, rot, scale = local_mat.decompose()
-            t_off = skin_rel + 48 * bone_index
-            struct.pack_into("<4f", data, t_off + 0, loc.x, loc.y, loc.z, 1.0)
-            struct.pack_into("<4f", data, t_off + 16, rot.x, rot.y, rot.z, rot.w)
-            struct.pack_into("<4f", data, t_off + 32, scale.x, scale.y, scale.z, 1.0)
+            bone_indices.append(bone_index)
+            transforms.append((*loc, 1.0, rot.x, rot.y, rot.z, rot.w, *scale, 1.0))
+
+        if bone_indices:
+            # View the skinning table in place and write every matched bone in one assignment.
+            table = np.frombuffer(data, dtype="<f4", count=12 * bone_count, offset=skin_rel)
+            table.reshape(bone_count, 12)[bone_indices] = transforms
 
         return bytes(data)
     except (struct.error, TypeError, ValueError):
         return skeleton_bytes
 
 
+def _fcurve_points(fc: bpy.types.FCurve, prop: str = "co") -> np.ndarray:
+    """Return an fcurve's keyframe ``prop`` vectors as an ``(n, 2)`` array."""
+    points = fc.keyframe_points
+    coords = np.empty(len(points) * 2, dtype=np.float32)
+    points.foreach_get(prop, coords)
+    return coords.reshape(-1, 2)
+
+
+def _fcurve_is_constant(fc: bpy.types.FCurve, co: np.ndarray) -> bool:
+    if fc.modifiers:
+        return False
+    if len(co) == 0 or (len(co) == 1 and fc.extrapolation == "CONSTANT"):
+        return True
+    value = co[0, 1]
+    if not (co[:, 1] == value).all():
+        return False
+    return all(
+        (_fcurve_points(fc, prop)[:, 1] == value).all() for prop in ("handle_left", "handle_right")
+    )
+
+
+def _emit_keyframes(
+    buf: bytearray,
+    idx_offset: int,
+    float_offset: int,
+    key_frames: np.ndarray,
+    key_values: np.ndarray,
+    index_dtype: str,
+    value_dtype: str,
+) -> None:
+    """Cast key frames and ``(x, y, z, w)`` values straight into their blocks of ``buf``."""
+    key_count = len(key_frames)
+    # Numpy casts wrap or overflow silently where struct.pack used to raise, so check ranges.
+    if key_count:
+        frame_limit = np.iinfo(index_dtype).max
+        if key_frames.min() < 0 or key_frames.max() > frame_limit:
+            raise ValueError(f"Keyframe index out of range 0..{frame_limit}")
+        finite = np.abs(key_values[np.isfinite(key_values)])
+        value_limit = float(np.finfo(value_dtype).max)
+        if finite.size and finite.max() > value_limit:
+            raise ValueError(f"Keyframe value exceeds the {value_dtype} range (±{value_limit:g})")
+    frames = np.frombuffer(buf, dtype=index_dtype, count=key_count, offset=idx_offset)
+    frames[:] = key_frames
+    values = np.frombuffer(buf, dtype=value_dtype, count=key_count * 4, offset=float_offset)
+    values.reshape(key_count, 4)[:] = key_values
+
+
+def _write_animation_bytes(
+    nodes: list[tuple[int, list[tuple[int, int, int, np.ndarray, np.ndarray]]]],
+    frame_count: int,
+    index_size: int,
+    float_size: int,
+) -> bytearray:
+    """Serialize sampled nodes into an EAN animation block without touching bpy."""
+    index_dtype = "<u1" if index_size == 0 else "<u2"
+    value_dtype = "<f2" if float_size == 1 else "<f4"
+
+    index_width = 1 if index_size == 0 else 2
+    value_width = 8 if float_size == 1 else 16
+
+    # Every offset follows from the key counts, so the block is sized up front and then
+    # filled in place; only the 16-byte padding before each value block needs computing.
+    total = 16 + 4 * len(nodes)
+    for _, comps in nodes:
+        total += 8 + 4 * len(comps)
+        for comp in comps:
+            key_count = len(comp[3])
+            total += 16 + key_count * index_width
+            total += (-total) % 16 + key_count * value_width
+    total += 12
+
+    anim = bytearray(total)
+    anim[2] = index_size
+    anim[3] = float_size
+    _ANIM_HEADER.pack_into(anim, 4, frame_count, len(nodes), 16 if nodes else 0)
+
+    node_table_offset = 16
+    offset = node_table_offset + 4 * len(nodes)
+    for node_idx, (bone_idx, comps) in enumerate(nodes):
+        node_start = offset
+        _U32.pack_into(anim, node_table_offset + 4 * node_idx, node_start)
+        _NODE_HEADER.pack_into(anim, node_start, bone_idx, len(comps), 8 if comps else 0)
+
+        comp_table_offset = node_start + 8
+        offset = comp_table_offset + 4 * len(comps)
+        for comp_idx, (ctype, i01, i02, key_frames, key_values) in enumerate(comps):
+            comp_start = offset
+            _U32.pack_into(anim, comp_table_offset + 4 * comp_idx, comp_start - node_start)
+            key_count = len(key_frames)
+
+            idx_offset = comp_start + 16
+            float_offset = idx_offset + key_count * index_width
+            float_offset += (-float_offset) % 16
+            offset = float_offset + key_count * value_width
+
+            _COMP_HEADER.pack_into(
+                anim,
+                comp_start,
+                ctype,
+                i01,
+                i02,
+                key_count,
+                idx_offset - comp_start,
+                float_offset - comp_start,
+            )
+            _emit_keyframes(
+                anim, idx_offset, float_offset, key_frames, key_values, index_dtype, value_dtype
+            )
+
+    return anim
+
+
 def _build_animation_bytes(
     action: bpy.types.Action,
     arm_obj: bpy.types.Object,
     esk: ESK_File,
     rest_locals: dict[str, mathutils.Matrix],
-    depsgraph: bpy.types.Depsgraph,
     add_dummy_rest: bool = False,
     float_size: int = 1,
-) -> bytes:
-    scene = bpy.context.scene
-    original_frame = scene.frame_current
-    original_action = arm_obj.animation_data.action if arm_obj.animation_data else None
-
-    frames_by_bone: dict[str, dict[str, set[int]]] = defaultdict(
-        lambda: {"pos": set(), "rot": set(), "scl": set()}
-    )
+) -> bytes | bytearray:
+    # Keyed frames per bone, one flat map per component; sets only exist for keyed channels.
+    pos_frames: defaultdict[str, set[int]] = defaultdict(set)
+    rot_frames: defaultdict[str, set[int]] = defaultdict(set)
+    scl_frames: defaultdict[str, set[int]] = defaultdict(set)
+    frames_by_target = {"pos": pos_frames, "rot": rot_frames, "scl": scl_frames}
     global_frames: set[int] = set()
+    varying_components: set[tuple[str, str]] = set()
+
+    # Channels are evaluated straight from their fcurves, so sampling never has to step the
+    # scene and re-evaluate the depsgraph. Keys sitting on whole frames are read back from the
+    # bulk-fetched control points; other frames fall back to FCurve.evaluate.
+    channels: dict[tuple[str, str], list[tuple[bpy.types.FCurve, dict[int, float]] | None]] = {}
 
     for fc in action.fcurves:
-        if not fc.data_path.startswith('pose.bones["'):
+        channel = _POSE_CHANNEL_RE.match(fc.data_path)
+        if channel is None:
             continue
-        bone_name = fc.data_path.split('"')[1]
-        target = None
-        path_tail = fc.data_path.rsplit(".", 1)[-1]
-        match path_tail:
-            case "location":
-                target = "pos"
-            case "rotation_quaternion":
-                target = "rot"
-            case "scale":
-                target = "scl"
-        if target is None:
-            continue
-        frames = {int(round(pt.co.x)) for pt in fc.keyframe_points}
-        frames_by_bone[bone_name][target].update(frames)
+        bone_name = channel.group(1)
+        target = _CHANNEL_TARGETS[channel.group(2)]
+        co = _fcurve_points(fc)
+        key_frames = co[:, 0]
+        frames = set(np.rint(key_frames).astype(np.int64).tolist())
+        frames_by_target[target][bone_name].update(frames)
         global_frames.update(frames)
+        if fc.mute:
+            # Muted curves do not drive the pose, so the channel keeps the pose bone's value.
+            continue
+        if not _fcurve_is_constant(fc, co):
+            varying_components.add((bone_name, target))
+
+        curves = channels.setdefault((bone_name, target), [None] * _CHANNEL_SIZES[target])
+        if 0 <= fc.array_index < len(curves):
+            key_values: dict[int, float] = {}
+            if not fc.modifiers:
+                # Modifiers change the curve even on its keys, so those always go through
+                # FCurve.evaluate.
+                on_frame = key_frames == np.rint(key_frames)
+                key_values = dict(
+                    zip(
+                        key_frames[on_frame].astype(np.int64).tolist(),
+                        co[on_frame, 1].tolist(),
+                        strict=True,
+                    )
+                )
+            curves[fc.array_index] = (fc, key_values)
+
+    # A component whose fcurves are all flat evaluates to the same value on every frame,
+    # so a single sample is enough; padding fills in the first/last frames. Baked rotation
+    # and scale only stay independent of each other under a uniform rest scale.
+    uniform_rest: dict[str, bool] = {}
+    for target, bone_frames in frames_by_target.items():
+        for bone_name, frames in bone_frames.items():
+            if len(frames) <= 1 or (bone_name, target) in varying_components:
+                continue
+            if target != "pos" and bone_name not in uniform_rest:
+                rest_local = rest_locals.get(bone_name, mathutils.Matrix.Identity(4))
+                uniform_rest[bone_name] = _rest_trs(rest_local)[4]
+            if target == "pos" or uniform_rest[bone_name]:
+                bone_frames[bone_name] = {min(frames)}
 
     dummy_bones: set[str] = set()
     if add_dummy_rest:
         for bone in esk.bones:
             if bone.index == 0:
                 continue
-            bone_frames = frames_by_bone[bone.name]
-            if bone_frames["pos"] or bone_frames["rot"] or bone_frames["scl"]:
+            if any(bone_frames.get(bone.name) for bone_frames in frames_by_target.values()):
                 continue
             dummy_bones.add(bone.name)
-            bone_frames["pos"].add(0)
-            bone_frames["rot"].add(0)
-            bone_frames["scl"].add(0)
+            for bone_frames in frames_by_target.values():
+                bone_frames[bone.name] = {0}
             global_frames.add(0)
 
     if not global_frames:
-        scene.frame_set(original_frame)
-        if arm_obj.animation_data:
-            arm_obj.animation_data.action = original_action
         return b""
 
     frame_count = max(global_frames) + 1
     index_size = 1 if frame_count > 255 else 0
     float_size = 2 if int(float_size) == 2 else 1
 
-    # Map frames to bones to minimize frame_set calls.
-    frames_to_bones: dict[int, list[str]] = defaultdict(list)
-    sample_frames_by_bone: dict[str, set[int]] = {}
-    for bone_name, comp_frames in frames_by_bone.items():
-        sample_frames = comp_frames["pos"] | comp_frames["rot"] | comp_frames["scl"]
-        if not sample_frames:
-            continue
-        sample_frames_by_bone[bone_name] = sample_frames
-        if bone_name in dummy_bones:
-            continue
-        for f in sample_frames:
-            frames_to_bones[f].append(bone_name)
+    # Each bone's sample frames are sorted once here and reused for sampling and emission.
+    sample_frames_by_bone: dict[str, list[int]] = {}
+    for bone_name in pos_frames.keys() | rot_frames.keys() | scl_frames.keys():
+        sample_frames = set().union(
+            *(bone_frames.get(bone_name, ()) for bone_frames in frames_by_target.values())
+        )
+        if sample_frames:
+            sample_frames_by_bone[bone_name] = sorted(sample_frames)
 
     samples: dict[
         str, dict[int, tuple[mathutils.Vector, mathutils.Quaternion, mathutils.Vector]]
     ] = defaultdict(dict)
-    for frame in sorted(frames_to_bones.keys()):
-        scene.frame_set(frame)
-        if hasattr(bpy.context.view_layer, "update"):
-            bpy.context.view_layer.update()
-        arm_eval = arm_obj.evaluated_get(depsgraph)
-        for bone_name in frames_to_bones[frame]:
-            pbone = arm_eval.pose.bones.get(bone_name)
-            if pbone is None:
-                continue
-            delta = mathutils.Matrix.LocRotScale(
-                pbone.location.copy(),
-                pbone.rotation_quaternion.copy(),
-                pbone.scale.copy(),
+    for bone_name, sample_frames in sample_frames_by_bone.items():
+        if bone_name in dummy_bones:
+            continue
+        pbone = arm_obj.pose.bones.get(bone_name)
+        if pbone is None:
+            continue
+        rest = _rest_trs(rest_locals.get(bone_name, mathutils.Matrix.Identity(4)))
+        defaults = {
+            "pos": tuple(pbone.location),
+            "rot": tuple(pbone.rotation_quaternion),
+            "scl": tuple(pbone.scale),
+        }
+        # Unkeyed channels keep the pose bone's own value.
+        curves = {target: channels.get((bone_name, target)) for target in defaults}
+        bone_samples = samples[bone_name]
+        for frame in sample_frames:
+            values = {}
+            for target, default in defaults.items():
+                target_curves = curves[target]
+                if target_curves is None:
+                    values[target] = default
+                    continue
+                target_values = list(default)
+                for index, curve in enumerate(target_curves):
+                    if curve is None:
+                        continue
+                    fc, key_values = curve
+                    value = key_values.get(frame)
+                    target_values[index] = fc.evaluate(frame) if value is None else value
+                values[target] = target_values
+            bone_samples[frame] = _bake_rest_delta(
+                rest,
+                mathutils.Vector(values["pos"]),
+                mathutils.Quaternion(values["rot"]),
+                mathutils.Vector(values["scl"]),
             )
-            rest_local = rest_locals.get(bone_name, mathutils.Matrix.Identity(4))
-            baked_local = rest_local @ delta
-            loc, rot, scl = baked_local.decompose()
-            samples[bone_name][frame] = (loc, rot, scl)
 
     if dummy_bones:
         for bone_name in dummy_bones:
             rest_local = rest_locals.get(bone_name, mathutils.Matrix.Identity(4))
-            loc, rot, scl = rest_local.decompose()
-            samples[bone_name][0] = (loc, rot, scl)
+            samples[bone_name][0] = _rest_trs(rest_local)[1:4]
 
-    nodes: list[
-        tuple[int, list[tuple[int, int, int, list[tuple[int, float, float, float, float]]]]]
-    ] = []
+    nodes: list[tuple[int, list[tuple[int, int, int, np.ndarray, np.ndarray]]]] = []
+    end_frame = frame_count - 1
 
+    pose_bone_names = set(arm_obj.pose.bones.keys())
     for bone in esk.bones:
         if bone.index == 0:
             continue  # skip the dummy root
-        pbone = arm_obj.pose.bones.get(bone.name)
-        if pbone is None:
+        if bone.name not in pose_bone_names:
             continue
 
-        pos_frames = frames_by_bone[bone.name]["pos"]
-        rot_frames = frames_by_bone[bone.name]["rot"]
-        scale_frames = frames_by_bone[bone.name]["scl"]
         sample_frames = sample_frames_by_bone.get(bone.name)
         if not sample_frames:
             continue
+        bone_samples = samples[bone.name]
+
+        # All three components are filled in a single pass over the sorted frames into
+        # parallel frame/value arrays, with one spare leading/trailing slot for padding.
+        # Values stay float64 so the writer's half/float casts round like struct packing.
+        comp_frames = [
+            (comp_tag, frames)
+            for comp_tag, frames in (
+                (_POS_TAG, pos_frames.get(bone.name)),
+                (_ROT_TAG, rot_frames.get(bone.name)),
+                (_SCL_TAG, scl_frames.get(bone.name)),
+            )
+            if frames
+        ]
+        key_frames = [np.empty(len(frames) + 2, dtype=np.int64) for _, frames in comp_frames]
+        key_values = [np.empty((len(frames) + 2, 4)) for _, frames in comp_frames]
+        counts = [1] * len(comp_frames)
+        for f in sample_frames:
+            loc, rot, scl = bone_samples[f]
+            for slot, (comp_tag, frames) in enumerate(comp_frames):
+                if f not in frames:
+                    continue
+                count = counts[slot]
+                key_frames[slot][count] = f
+                if comp_tag == _POS_TAG:
+                    key_values[slot][count] = (loc.x, loc.y, loc.z, 1.0)
+                elif comp_tag == _ROT_TAG:
+                    key_values[slot][count] = (rot.x, rot.y, rot.z, rot.w)
+                else:
+                    key_values[slot][count] = (scl.x, scl.y, scl.z, 1.0)
+                counts[slot] = count + 1
 
-        comps: list[tuple[int, int, int, list[tuple[int, float, float, float, float]]]] = []
-
-        bone_name = bone.name
-
-        def build_component(
-            comp_type: ComponentType,
-            frames: set[int],
-            pad_last: bool = True,
-            *,
-            bone_name_ref: str = bone_name,
+        pad_last = bone.name not in dummy_bones
+        comps: list[tuple[int, int, int, np.ndarray, np.ndarray]] = []
+        for (comp_tag, _), frames, values, count in zip(
+            comp_frames, key_frames, key_values, counts, strict=True
         ):
-            if not frames:
-                return None
-            keyframes = []
-            for f in sorted(frames):
-                loc, rot, scl = samples[bone_name_ref][f]
-                match comp_type:
-                    case ComponentType.Position:
-                        vals = (loc.x, loc.y, loc.z, 1.0)
-                    case ComponentType.Rotation:
-                        vals = (rot.x, rot.y, rot.z, rot.w)
-                    case _:
-                        vals = (scl.x, scl.y, scl.z, 1.0)
-                keyframes.append((f, *vals))
-
-            end_frame = frame_count - 1
-            if keyframes[0][0] != 0:
-                first_vals = keyframes[0][1:]
-                keyframes.insert(0, (0, *first_vals))
-            if pad_last and keyframes[-1][0] != end_frame:
-                last_vals = keyframes[-1][1:]
-                keyframes.append((end_frame, *last_vals))
-
-            return comp_type, 7, 0, keyframes
-
-        dummy_only = bone.name in dummy_bones
-        for comp_type, frames in (
-            (ComponentType.Position, pos_frames),
-            (ComponentType.Rotation, rot_frames),
-            (ComponentType.Scale, scale_frames),
-        ):
-            comp = build_component(comp_type, frames, pad_last=not dummy_only)
-            if comp:
-                comps.append(comp)
+            start = 1
+            if frames[1] != 0:
+                start = 0
+                frames[0] = 0
+                values[0] = values[1]
+            stop = count
+            if pad_last and frames[count - 1] != end_frame:
+                stop = count + 1
+                frames[count] = end_frame
+                values[count] = values[count - 1]
+            comps.append((comp_tag, 7, 0, frames[start:stop], values[start:stop]))
 
         if comps:
             nodes.append((bone.index, comps))
 
-    scene.frame_set(original_frame)
-
     if not nodes:
         return b""
 
-    anim = bytearray()
-    anim.extend(b"\x00\x00")
-    anim.append(index_size)
-    anim.append(float_size)
-    anim.extend(struct.pack("<I", frame_count))
-    anim.extend(struct.pack("<I", len(nodes)))
-    anim.extend(struct.pack("<I", 16 if nodes else 0))
-
-    node_table_offset = len(anim)
-    for _ in nodes:
-        anim.extend(b"\x00\x00\x00\x00")
-
-    for node_idx, (bone_idx, comps) in enumerate(nodes):
-        node_start = len(anim)
-        anim[node_table_offset + 4 * node_idx : node_table_offset + 4 * node_idx + 4] = struct.pack(
-            "<I", node_start
-        )
-        anim.extend(struct.pack("<h", bone_idx))
-        anim.extend(struct.pack("<h", len(comps)))
-        anim.extend(struct.pack("<I", 8 if comps else 0))
-
-        comp_table_offset = len(anim)
-        for _ in comps:
-            anim.extend(b"\x00\x00\x00\x00")
-
-        for comp_idx, (ctype, i01, i02, keyframes) in enumerate(comps):
-            comp_start = len(anim)
-            anim[comp_table_offset + 4 * comp_idx : comp_table_offset + 4 * comp_idx + 4] = (
-                struct.pack("<I", comp_start - node_start)
-            )
-
-            anim.extend(struct.pack("<BBhI", ctype, i01, i02, len(keyframes)))
-            anim.extend(struct.pack("<II", 0, 0))
-
-            idx_offset = len(anim)
-            for frame_idx, *_vals in keyframes:
-                if index_size == 0:
-                    anim.extend(struct.pack("<B", frame_idx))
-                else:
-                    anim.extend(struct.pack("<H", frame_idx))
-
-            _align16(anim)
+    return _write_animation_bytes(nodes, frame_count, index_size, float_size)
 
-            float_offset = len(anim)
-            for _, x, y, z, w in keyframes:
-                if float_size == 1:
-                    anim.extend(_pack_half(x))
-                    anim.extend(_pack_half(y))
-                    anim.extend(_pack_half(z))
-                    anim.extend(_pack_half(w))
-                else:
-                    anim.extend(struct.pack("<4f", x, y, z, w))
-
-            anim[comp_start + 8 : comp_start + 12] = struct.pack("<I", idx_offset - comp_start)
-            anim[comp_start + 12 : comp_start + 16] = struct.pack("<I", float_offset - comp_start)
 
-    anim.extend(b"\x00" * 12)
+def _write_ean_file(
+    filepath: str,
+    header_version: int,
+    header_i17: int,
+    skeleton_bytes: bytes,
+    animations_by_index: dict[int, tuple[bytes | bytearray, str]],
+    animation_count: int,
+) -> None:
+    """Lay out the EAN file up front and stream its sections straight to disk."""
+    skeleton_offset = 32
+    animation_table_offset = 0
+    name_table_offset = 0
+    anim_offsets = [0] * animation_count
+    name_offsets = [0] * animation_count
+    anim_pads = [0] * animation_count
+    labels = [b""] * animation_count
+
+    pos = skeleton_offset + len(skeleton_bytes)
+    if animation_count > 0:
+        animation_table_offset = pos
+        pos += 4 * animation_count
+        for idx in range(animation_count):
+            entry = animations_by_index.get(idx)
+            if not entry:
+                continue
+            anim_pads[idx] = (-pos) % 16
+            pos += anim_pads[idx]
+            anim_offsets[idx] = pos
+            pos += len(entry[0])
+
+        name_table_offset = pos
+        pos += 4 * animation_count
+        for idx in range(animation_count):
+            entry = animations_by_index.get(idx)
+            if not entry:
+                continue
+            labels[idx] = entry[1].encode("ascii", "ignore") + b"\x00"
+            name_offsets[idx] = pos
+            pos += len(labels[idx])
+
+    header = bytearray(32)
+    header[0:8] = bytes([35, 69, 65, 78, 254, 255, 32, 0])
+    struct.pack_into("<I", header, 8, header_version)
+    header[16] = 0  # is_camera
+    header[17] = header_i17 & 0xFF
+    struct.pack_into(
+        "<HIII",
+        header,
+        18,
+        animation_count,
+        skeleton_offset,
+        animation_table_offset,
+        name_table_offset,
+    )
 
-    # Restore original action and frame
-    scene.frame_set(original_frame)
-    if arm_obj.animation_data:
-        arm_obj.animation_data.action = original_action
-    return bytes(anim)
+    with open(filepath, "wb", buffering=1 << 20) as f:
+        f.write(header)
+        f.write(skeleton_bytes)
+        if animation_count <= 0:
+            return
+        f.write(struct.pack(f"<{animation_count}I", *anim_offsets))
+        for idx in range(animation_count):
+            entry = animations_by_index.get(idx)
+            if not entry:
+                continue
+            f.write(b"\x00" * anim_pads[idx])
+            f.write(entry[0])
+        f.write(struct.pack(f"<{animation_count}I", *name_offsets))
+        for label in labels:
+            f.write(label)
 
 
 def export_ean(
-    filepath: str, arm_obj: bpy.types.Object, add_dummy_rest: bool = False
+    filepath: str,
+    arm_obj: bpy.types.Object,
+    add_dummy_rest: bool = False,
+    half_floats: bool | None = None,
 ) -> tuple[bool, str | None]:
     if arm_obj is None or arm_obj.type != "ARMATURE":
         return False, "Select an armature to export."
 
-    original_action = None
-    restore_action = False
-
     try:
         esk, skeleton_bytes, rest_locals = _build_skeleton_from_armature(arm_obj)
         header_version = _to_int(arm_obj.get("ean_i08", 37505), 37505)
@@ -609,6 +832,9 @@ def export_ean(
             header_version = int(source_template.get("version", header_version))
             header_i17 = int(source_template.get("i17", header_i17))
             preferred_float_size = int(source_template.get("float_size", preferred_float_size))
+        if half_floats is not None:
+            # 1 = 16-bit half floats, 2 = 32-bit floats; None keeps the source EAN's precision.
+            preferred_float_size = 1 if half_floats else 2
         actual_bone_names = {b.name for b in esk.bones if b.index != 0}
 
         collected_actions = _collect_actions(actual_bone_names)
@@ -625,27 +851,17 @@ def export_ean(
         if armature_prefixed_actions:
             actions = armature_prefixed_actions
 
-        if arm_obj.animation_data is None:
-            arm_obj.animation_data_create()
-        original_action = arm_obj.animation_data.action
-        restore_action = True
-
-        animations_by_index: dict[int, tuple[bytes, str]] = {}
+        animations_by_index: dict[int, tuple[bytes | bytearray, str]] = {}
         max_index = -1
         for fallback_idx, act in enumerate(sorted(actions, key=_action_sort_key)):
             anim_index = _action_anim_index(act, fallback_idx)
             _, anim_label = _parse_anim_meta(act.name, fallback_idx)
 
-            arm_obj.animation_data.action = act
-            if hasattr(bpy.context.view_layer, "update"):
-                bpy.context.view_layer.update()
-
             anim_bytes = _build_animation_bytes(
                 act,
                 arm_obj,
                 esk,
                 rest_locals,
-                bpy.context.view_layer.depsgraph,
                 add_dummy_rest=add_dummy_rest,
                 float_size=preferred_float_size,
             )
@@ -663,61 +879,20 @@ def export_ean(
 
         animation_count = max_index + 1
 
-        out = bytearray([35, 69, 65, 78, 254, 255, 32, 0])
-        out.extend(struct.pack("<I", header_version))
-        out.extend(b"\x00\x00\x00\x00")
-        out.append(0)  # is_camera
-        out.append(header_i17 & 0xFF)
-        out.extend(struct.pack("<H", animation_count))
-        out.extend(b"\x00" * 12)
-
-        skeleton_offset = len(out)
-        out[20:24] = struct.pack("<I", skeleton_offset)
-        out.extend(skeleton_bytes)
-
-        if animation_count > 0:
-            out[24:28] = struct.pack("<I", len(out))
-            animation_table_offset = len(out)
-            for _ in range(animation_count):
-                out.extend(b"\x00\x00\x00\x00")
-
-            for idx in range(animation_count):
-                entry = animations_by_index.get(idx)
-                if not entry:
-                    continue
-                anim_bytes, _ = entry
-                _align16(out)
-                out[animation_table_offset + 4 * idx : animation_table_offset + 4 * idx + 4] = (
-                    struct.pack("<I", len(out))
-                )
-                out.extend(anim_bytes)
-
-            out[28:32] = struct.pack("<I", len(out))
-            name_table_offset = len(out)
-            for _ in range(animation_count):
-                out.extend(b"\x00\x00\x00\x00")
-
-            for idx in range(animation_count):
-                entry = animations_by_index.get(idx)
-                if not entry:
-                    continue
-                _, anim_label = entry
-                out[name_table_offset + 4 * idx : name_table_offset + 4 * idx + 4] = struct.pack(
-                    "<I", len(out)
-                )
-                out.extend(anim_label.encode("ascii", "ignore"))
-                out.append(0)
-
-        Path(filepath).write_bytes(out)
+        _write_ean_file(
+            filepath,
+            header_version,
+            header_i17,
+            skeleton_bytes,
+            animations_by_index,
+            animation_count,
+        )
         return True, None
     except (RuntimeError, OSError, ValueError, TypeError, struct.error) as exc:
         import traceback
 
         traceback.print_exc()
         return False, f"Unexpected error while exporting: {exc}"
-    finally:
-        if restore_action and getattr(arm_obj, "animation_data", None):
-            arm_obj.animation_data.action = original_action
 
 
 __all__ = ["export_ean"]
@@ -4,10 +4,18 @@ import os
 
 import bpy
 import mathutils
+import numpy as np
 
 from ...ui import link_scd_armatures
 from ..ESK import build_armature
-from .EAN import ComponentType, EANAnimation, EANFile, EANNode, read_ean
+from .EAN import (
+    ComponentType,
+    EANAnimation,
+    EANAnimationComponent,
+    EANFile,
+    EANNode,
+    read_ean,
+)
 
 
 def _find_cam_node(anim: EANAnimation) -> EANNode | None:
@@ -31,15 +39,12 @@ def _find_target_node(anim: EANAnimation, cam_node: EANNode | None) -> EANNode |
     return cam_node
 
 
-def _map_vec(x: float, y: float, z: float) -> tuple[float, float, float]:
-    return (x, -z, y)
-
-
-def _get_component(node: EANNode, comp_type: ComponentType):
+def _components_by_type(node: EANNode) -> dict[ComponentType, EANAnimationComponent]:
+    # The first component of each type wins, matching a linear search of node.components.
+    components: dict[ComponentType, EANAnimationComponent] = {}
     for comp in node.components:
-        if comp.type == comp_type:
-            return comp
-    return None
+        components.setdefault(comp.type, comp)
+    return components
 
 
 def _create_skeleton_matrices(esk) -> None:
@@ -64,23 +69,33 @@ def _build_rest_from_esk(
     abs_mats: dict[str, mathutils.Matrix] = {}
     local_mats: dict[str, mathutils.Matrix] = {}
 
-    def compute_abs(bone) -> mathutils.Matrix:
+    bones = esk.bones
+    for bone in bones:
         if bone.name in abs_mats:
-            return abs_mats[bone.name]
-        mat_local = (
-            bone.matrix.copy() if getattr(bone, "matrix", None) else mathutils.Matrix.Identity(4)
-        )
-        if 0 <= bone.parent_index < len(esk.bones):
-            parent = esk.bones[bone.parent_index]
-            parent_abs = compute_abs(parent)
-            abs_mats[bone.name] = parent_abs @ mat_local
-        else:
-            abs_mats[bone.name] = mat_local
-        local_mats[bone.name] = mat_local
-        return abs_mats[bone.name]
-
-    for b in esk.bones:
-        compute_abs(b)
+            continue
+        # Parents normally precede their children, so the walk up usually stops straight away;
+        # out-of-order parents are resolved root-first without recursion.
+        chain = [bone]
+        parent_index = bone.parent_index
+        while 0 <= parent_index < len(bones):
+            parent = bones[parent_index]
+            if parent.name in abs_mats or parent in chain:
+                break
+            chain.append(parent)
+            parent_index = parent.parent_index
+        for link in reversed(chain):
+            mat_local = (
+                link.matrix.copy()
+                if getattr(link, "matrix", None)
+                else mathutils.Matrix.Identity(4)
+            )
+            parent_abs = (
+                abs_mats.get(bones[link.parent_index].name)
+                if 0 <= link.parent_index < len(bones)
+                else None
+            )
+            abs_mats[link.name] = parent_abs @ mat_local if parent_abs is not None else mat_local
+            local_mats[link.name] = mat_local
 
     return abs_mats, local_mats
 
@@ -121,43 +136,201 @@ def _get_rest_matrices(
     return armature_obj, ean_local
 
 
+def _component_arrays(comp) -> tuple[np.ndarray, np.ndarray]:
+    keyframes = comp.keyframes if comp is not None else []
+    frames = np.fromiter((k.frame_index for k in keyframes), dtype=np.int64, count=len(keyframes))
+    values = np.array([(k.x, k.y, k.z, k.w) for k in keyframes], dtype=np.float64).reshape(-1, 4)
+    order = np.argsort(frames, kind="stable")
+    return frames[order], values[order]
+
+
 def _interp_component(
-    comp, frame: int, default_vals: tuple[float, float, float, float]
-) -> tuple[float, float, float, float]:
-    if comp is None or not comp.keyframes:
-        return default_vals
-
-    keyframes = sorted(comp.keyframes, key=lambda k: k.frame_index)
-    prev = None
-    nxt = None
-    for keyframe in keyframes:
-        if keyframe.frame_index == frame:
-            return (keyframe.x, keyframe.y, keyframe.z, keyframe.w)
-        if keyframe.frame_index < frame:
-            prev = keyframe
-        if keyframe.frame_index > frame:
-            nxt = keyframe
-            break
-
-    if prev is None:
-        prev_vals = default_vals
-        prev_frame = frame - 1
+    key_frames: np.ndarray,
+    key_values: np.ndarray,
+    frames: np.ndarray,
+    default_vals: tuple[float, float, float, float],
+    slerp: bool = False,
+) -> np.ndarray:
+    default = np.array(default_vals, dtype=np.float64)
+    if not len(key_frames):
+        return np.tile(default, (len(frames), 1))
+
+    # Frames before the first or after the last key blend towards the default one frame out.
+    idx = np.searchsorted(key_frames, frames, side="left")
+    has_prev = idx > 0
+    has_next = idx < len(key_frames)
+    prev_idx = np.maximum(idx - 1, 0)
+    next_idx = np.minimum(idx, len(key_frames) - 1)
+    exact = has_next & (key_frames[next_idx] == frames)
+
+    prev_frame = np.where(has_prev, key_frames[prev_idx], frames - 1)
+    next_frame = np.where(has_next, key_frames[next_idx], frames + 1)
+    prev_vals = np.where(has_prev[:, None], key_values[prev_idx], default)
+    next_vals = np.where(has_next[:, None], key_values[next_idx], default)
+
+    factor = (frames - prev_frame) / (next_frame - prev_frame).astype(np.float64)
+    if slerp:
+        result = _slerp(prev_vals, next_vals, factor)
     else:
-        prev_vals = (prev.x, prev.y, prev.z, prev.w)
-        prev_frame = prev.frame_index
+        result = prev_vals + (next_vals - prev_vals) * factor[:, None]
+    result[exact] = key_values[next_idx[exact]]
+    return result
+
+
+def _slerp(q0: np.ndarray, q1: np.ndarray, factor: np.ndarray) -> np.ndarray:
+    # Rows are quaternions in any fixed component order; the blend takes the shorter arc.
+    dot = np.einsum("ij,ij->i", q0, q1)
+    q1 = np.where((dot < 0.0)[:, None], -q1, q1)
+    dot = np.abs(dot)
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    # Nearly parallel quaternions fall back to a plain lerp to avoid dividing by ~0.
+    near = sin_theta < 1e-6
+    safe_sin = np.where(near, 1.0, sin_theta)
+    w0 = np.where(near, 1.0 - factor, np.sin((1.0 - factor) * theta) / safe_sin)
+    w1 = np.where(near, factor, np.sin(factor * theta) / safe_sin)
+    result = q0 * w0[:, None] + q1 * w1[:, None]
+    norms = np.linalg.norm(result, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return result / norms
+
+
+def _quats_to_matrices(quats: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    w, x, y, z = (quats / norms).T
+    return np.stack(
+        (
+            np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+            np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+            np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1),
+        ),
+        axis=1,
+    )
 
-    if nxt is None:
-        next_vals = default_vals
-        next_frame = frame + 1
-    else:
-        next_vals = (nxt.x, nxt.y, nxt.z, nxt.w)
-        next_frame = nxt.frame_index
 
-    if next_frame == prev_frame:
-        return prev_vals
+def _matrices_to_quats(mats: np.ndarray) -> np.ndarray:
+    m00, m01, m02 = mats[:, 0, 0], mats[:, 0, 1], mats[:, 0, 2]
+    m10, m11, m12 = mats[:, 1, 0], mats[:, 1, 1], mats[:, 1, 2]
+    m20, m21, m22 = mats[:, 2, 0], mats[:, 2, 1], mats[:, 2, 2]
+    trace = m00 + m11 + m22
+
+    # Each row takes the branch whose pivot is largest, as mat3_normalized_to_quat does.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s0 = np.sqrt(np.maximum(trace + 1.0, 0.0)) * 2.0
+        s1 = np.sqrt(np.maximum(1.0 + m00 - m11 - m22, 0.0)) * 2.0
+        s2 = np.sqrt(np.maximum(1.0 + m11 - m00 - m22, 0.0)) * 2.0
+        s3 = np.sqrt(np.maximum(1.0 + m22 - m00 - m11, 0.0)) * 2.0
+        candidates = (
+            np.stack((0.25 * s0, (m21 - m12) / s0, (m02 - m20) / s0, (m10 - m01) / s0), axis=-1),
+            np.stack(((m21 - m12) / s1, 0.25 * s1, (m01 + m10) / s1, (m02 + m20) / s1), axis=-1),
+            np.stack(((m02 - m20) / s2, (m01 + m10) / s2, 0.25 * s2, (m12 + m21) / s2), axis=-1),
+            np.stack(((m10 - m01) / s3, (m02 + m20) / s3, (m12 + m21) / s3, 0.25 * s3), axis=-1),
+        )
+    conditions = (
+        trace > 0.0,
+        (m00 >= m11) & (m00 >= m22),
+        m11 >= m22,
+        np.ones_like(trace, dtype=bool),
+    )
+    quats = np.select([c[:, None] for c in conditions], candidates)
+    quats[quats[:, 0] < 0.0] *= -1.0
+    return quats / np.linalg.norm(quats, axis=1, keepdims=True)
+
+
+def _quat_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack(
+        (
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+        ),
+        axis=-1,
+    )
+
+
+def _bake_rest_deltas(
+    rest_inv: np.ndarray,
+    locs: np.ndarray,
+    quats: np.ndarray,
+    scales: np.ndarray,
+    rest_trs: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Batched ``(rest_inv @ LocRotScale(loc, quat, scale)).decompose()``; quats are (w, x, y, z).
+    if rest_trs is not None:
+        rest_loc, rest_rot, rest_scale = rest_trs
+        uniform = abs(rest_scale[0] - rest_scale[1]) + abs(rest_scale[1] - rest_scale[2]) < 1e-6
+        if uniform and rest_scale[0] > 0.0 and (scales > 0.0).all():
+            # A uniform, positive rest scale commutes with the key rotation, so the delta can be
+            # taken on the components: one quaternion product instead of matrix round-trips.
+            norms = np.linalg.norm(quats, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            rest_conj = rest_rot * np.array((1.0, -1.0, -1.0, -1.0)) / np.dot(rest_rot, rest_rot)
+            delta_quats = _quat_multiply(rest_conj, quats / norms)
+            delta_quats[delta_quats[:, 0] < 0.0] *= -1.0
+            delta_quats /= np.linalg.norm(delta_quats, axis=1, keepdims=True)
+            rest_basis = _quats_to_matrices(rest_rot[None, :])[0]
+            delta_locs = (locs - rest_loc) @ rest_basis / rest_scale[0]
+            return delta_locs, delta_quats, scales / rest_scale[0]
+
+    basis = rest_inv[:3, :3] @ (_quats_to_matrices(quats) * scales[:, None, :])
+    delta_locs = locs @ rest_inv[:3, :3].T + rest_inv[:3, 3]
+
+    delta_scales = np.linalg.norm(basis, axis=1)
+    delta_scales[np.linalg.det(basis) < 0.0] *= -1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rotations = np.nan_to_num(basis / delta_scales[:, None, :])
+    return delta_locs, _matrices_to_quats(rotations), delta_scales
+
+
+def _bone_rest_info(rest_local: mathutils.Matrix) -> tuple:
+    rest_loc, rest_rot, rest_scale = rest_local.decompose()
+    return (
+        np.array(rest_local.inverted_safe(), dtype=np.float64),
+        (
+            np.array(rest_loc, dtype=np.float64),
+            np.array(rest_rot, dtype=np.float64),
+            np.array(rest_scale, dtype=np.float64),
+        ),
+        (rest_loc.x, rest_loc.y, rest_loc.z, 1.0),
+        (rest_rot.x, rest_rot.y, rest_rot.z, rest_rot.w),
+        (rest_scale.x, rest_scale.y, rest_scale.z, 1.0),
+    )
 
-    factor = (frame - prev_frame) / float(next_frame - prev_frame)
-    return tuple(prev_vals[i] + (next_vals[i] - prev_vals[i]) * factor for i in range(4))
+
+def _write_channel_keys(
+    action: bpy.types.Action,
+    data_path: str,
+    group: str,
+    frames: np.ndarray,
+    values: np.ndarray,
+) -> None:
+    # Keys are written straight into the fcurves in bulk instead of one keyframe_insert per
+    # frame; values has one column per array index of the property.
+    for index in range(values.shape[1]):
+        fc = action.fcurves.find(data_path, index=index)
+        if fc is None:
+            fc = action.fcurves.new(data_path, index=index, action_group=group)
+        column = values[:, index].astype(np.float32)
+        key_frames = frames
+        if len(column) > 2 and (column == column[0]).all():
+            # A flat channel evaluates the same from its end keys; keeping both preserves the
+            # key range the exporters derive the frame count from.
+            column = column[[0, -1]]
+            key_frames = frames[[0, -1]]
+        points = fc.keyframe_points
+        existing = len(points)
+        coords = np.empty((existing + len(key_frames), 2), dtype=np.float32)
+        if existing:
+            points.foreach_get("co", coords[:existing].ravel())
+        coords[existing:, 0] = key_frames
+        coords[existing:, 1] = column
+        points.add(len(key_frames))
+        points.foreach_set("co", coords.ravel())
+        fc.update()
 
 
 def _prep_action(obj: bpy.types.Object, action_name: str) -> None:
@@ -174,6 +347,16 @@ def _prep_action_data(data_block, action_name: str) -> None:
     action.use_fake_user = True
 
 
+def _key_object_location(obj: bpy.types.Object, comp: EANAnimationComponent) -> None:
+    action = obj.animation_data.action if obj.animation_data else None
+    if action is None or not comp.keyframes:
+        return
+    frames, values = _component_arrays(comp)
+    # EAN (x, y, z) maps to Blender (x, -z, y).
+    locations = np.stack((values[:, 0], -values[:, 2], values[:, 1]), axis=-1)
+    _write_channel_keys(action, "location", "Object Transforms", frames, locations)
+
+
 def _apply_camera_keyframes(camera: bpy.types.Object, anim: EANAnimation, action_name: str):
     node = _find_cam_node(anim)
     if node is None:
@@ -188,25 +371,30 @@ def _apply_camera_keyframes(camera: bpy.types.Object, anim: EANAnimation, action
     if camera.data and camera.data.animation_data and camera.data.animation_data.action:
         camera.data.animation_data.action["ean_index"] = anim.index
 
-    pos_comp = _get_component(node, ComponentType.Position)
-    scale_comp = _get_component(node, ComponentType.Scale)
+    components = _components_by_type(node)
+    pos_comp = components.get(ComponentType.Position)
+    scale_comp = components.get(ComponentType.Scale)
 
-    camera.rotation_mode = "XYZ"
+    if camera.rotation_mode != "XYZ":
+        camera.rotation_mode = "XYZ"
 
     if pos_comp:
-        for keyframe in pos_comp.keyframes:
-            camera.location = _map_vec(keyframe.x, keyframe.y, keyframe.z)
-            camera.keyframe_insert(data_path="location", frame=keyframe.frame_index)
-
-    if scale_comp:
-        for keyframe in scale_comp.keyframes:
-            roll_deg = -math.degrees(keyframe.x)
-            fov_deg = math.degrees(keyframe.y)
-            if hasattr(camera.data, "xv2_roll") and hasattr(camera.data, "xv2_fov"):
-                camera.data.xv2_roll = roll_deg
-                camera.data.xv2_fov = fov_deg
-                camera.data.keyframe_insert(data_path="xv2_roll", frame=keyframe.frame_index)
-                camera.data.keyframe_insert(data_path="xv2_fov", frame=keyframe.frame_index)
+        _key_object_location(camera, pos_comp)
+
+    data_action = camera.data.animation_data.action if camera.data.animation_data else None
+    if (
+        scale_comp
+        and scale_comp.keyframes
+        and data_action
+        and hasattr(camera.data, "xv2_roll")
+        and hasattr(camera.data, "xv2_fov")
+    ):
+        # Roll and FOV are stored in radians in the scale channel; both convert in one pass.
+        frames, values = _component_arrays(scale_comp)
+        degrees = np.degrees(values[:, :2])
+        degrees[:, 0] *= -1.0
+        _write_channel_keys(data_action, "xv2_roll", "", frames, degrees[:, :1])
+        _write_channel_keys(data_action, "xv2_fov", "", frames, degrees[:, 1:])
 
     if camera.animation_data and camera.animation_data.action:
         camera.animation_data.action.name = action_name
@@ -221,18 +409,16 @@ def _apply_target_keyframes(target: bpy.types.Object, anim: EANAnimation, action
         return
 
     _prep_action(target, action_name)
-    target.rotation_mode = "XYZ"
+    if target.rotation_mode != "XYZ":
+        target.rotation_mode = "XYZ"
 
     if target.animation_data and target.animation_data.action:
         target.animation_data.action["ean_index"] = anim.index
 
-    comp = _get_component(node, ComponentType.Rotation) or _get_component(
-        node, ComponentType.Position
-    )
+    components = _components_by_type(node)
+    comp = components.get(ComponentType.Rotation) or components.get(ComponentType.Position)
     if comp:
-        for keyframe in comp.keyframes:
-            target.location = _map_vec(keyframe.x, keyframe.y, keyframe.z)
-            target.keyframe_insert(data_path="location", frame=keyframe.frame_index)
+        _key_object_location(target, comp)
 
 
 def import_cam_ean(path: str) -> list[bpy.types.Object]:
@@ -244,18 +430,19 @@ def import_cam_ean(path: str) -> list[bpy.types.Object]:
 
     target_name = "CameraTarget"
     camera_name = "Node"
+    source_path = os.path.abspath(path)
 
     rig = bpy.data.objects.new("CameraRig", None)
     rig.empty_display_type = "PLAIN_AXES"
     rig.empty_display_size = 0.01
-    rig["ean_source"] = os.path.abspath(path)
+    rig["ean_source"] = source_path
     bpy.context.collection.objects.link(rig)
     created.append(rig)
 
     target = bpy.data.objects.new(target_name, None)
     target.empty_display_type = "PLAIN_AXES"
     target.empty_display_size = 0.25
-    target["ean_source"] = os.path.abspath(path)
+    target["ean_source"] = source_path
     bpy.context.collection.objects.link(target)
     target.parent = rig
     created.append(target)
@@ -265,7 +452,7 @@ def import_cam_ean(path: str) -> list[bpy.types.Object]:
     cam_data.sensor_fit = "VERTICAL"
     cam_data.sensor_width = 32.0
     cam_data.sensor_height = 32.0
-    cam_obj["ean_source"] = os.path.abspath(path)
+    cam_obj["ean_source"] = source_path
     bpy.context.collection.objects.link(cam_obj)
     cam_obj.parent = rig
     created.append(cam_obj)
@@ -337,7 +524,7 @@ def import_ean_animations(
 
     def _relink_armature(old_arm: bpy.types.Object, new_arm: bpy.types.Object) -> None:
         for coll in getattr(old_arm, "users_collection", []):
-            if new_arm.name not in {obj.name for obj in coll.objects}:
+            if coll.objects.get(new_arm.name) is None:
                 coll.objects.link(new_arm)
 
         new_arm.parent = old_arm.parent
@@ -346,7 +533,9 @@ def import_ean_animations(
         for child in list(old_arm.children):
             child.parent = new_arm
 
-        for obj in bpy.data.objects:
+        # Only objects that actually hold an ID reference to the old armature can need relinking.
+        users = bpy.data.user_map(subset={old_arm}, value_types={"OBJECT"}).get(old_arm, set())
+        for obj in users:
             for mod in obj.modifiers:
                 if mod.type == "ARMATURE" and getattr(mod, "object", None) is old_arm:
                     mod.object = new_arm
@@ -355,22 +544,21 @@ def import_ean_animations(
                     constraint.target = new_arm
 
     def _find_scd_sources(target_obj: bpy.types.Object) -> list[bpy.types.Object]:
-        sources: list[bpy.types.Object] = []
-        seen: set[str] = set()
-        for obj in bpy.data.objects:
-            if obj.type != "ARMATURE":
-                continue
-            for pbone in obj.pose.bones:
-                for constraint in pbone.constraints:
-                    if getattr(constraint, "target", None) is target_obj:
-                        if obj.name not in seen:
-                            sources.append(obj)
-                            seen.add(obj.name)
-                        break
-                else:
-                    continue
-                break
-        return sources
+        # Pose bone constraint targets count as ID users, so only armatures already referencing
+        # the target need their constraints checked. Sorting keeps bpy.data.objects' name order.
+        users = bpy.data.user_map(subset={target_obj}, value_types={"OBJECT"}).get(
+            target_obj, set()
+        )
+        return [
+            obj
+            for obj in sorted(users, key=lambda o: o.name)
+            if obj.type == "ARMATURE"
+            and any(
+                getattr(constraint, "target", None) is target_obj
+                for pbone in obj.pose.bones
+                for constraint in pbone.constraints
+            )
+        ]
 
     old_arm = target_armature if replace_armature else None
     ean_arm_name = ean.skeleton.bones[0].name if ean.skeleton and ean.skeleton.bones else "Armature"
@@ -407,6 +595,8 @@ def import_ean_animations(
     arm_obj["ean_i17"] = int(ean.i_17)
 
     action_prefix = arm_obj.name or ean_arm_name
+    # Rest data only depends on the bone, so it is derived once and shared by every animation.
+    bone_rest: dict[str, tuple] = {}
     for anim in sorted(ean.animations, key=lambda a: a.index):
         anim_base = anim.name or f"Anim_{anim.index}"
         action_name = f"{action_prefix}|{anim.index}|{anim_base}"
@@ -415,59 +605,68 @@ def import_ean_animations(
         arm_obj.animation_data_create()
         arm_obj.animation_data.action = action
 
-        anim_frames: set[int] = set()
+        anim_start: int | None = None
+        anim_end: int | None = None
 
         for node in anim.nodes:
             pose_bone = arm_obj.pose.bones.get(node.bone_name)
             if pose_bone is None:
                 continue
 
-            rest_local_ean = ean_local.get(node.bone_name, mathutils.Matrix.Identity(4))
-
-            pos_comp = _get_component(node, ComponentType.Position)
-            rot_comp = _get_component(node, ComponentType.Rotation)
-            scale_comp = _get_component(node, ComponentType.Scale)
-
-            frames: set[int] = {0}
-            if pos_comp:
-                frames.update(keyframe.frame_index for keyframe in pos_comp.keyframes)
-            if rot_comp:
-                frames.update(keyframe.frame_index for keyframe in rot_comp.keyframes)
-            if scale_comp:
-                frames.update(keyframe.frame_index for keyframe in scale_comp.keyframes)
-
-            rest_loc, rest_rot, rest_scale = rest_local_ean.decompose()
-            default_pos = (rest_loc.x, rest_loc.y, rest_loc.z, 1.0)
-            default_rot = (rest_rot.x, rest_rot.y, rest_rot.z, rest_rot.w)
-            default_scale = (rest_scale.x, rest_scale.y, rest_scale.z, 1.0)
-
-            pose_bone.rotation_mode = "QUATERNION"
-
-            for frame in sorted(frames):
-                anim_frames.add(frame)
-                pos_vals = _interp_component(pos_comp, frame, default_pos)
-                rot_vals = _interp_component(rot_comp, frame, default_rot)
-                scale_vals = _interp_component(scale_comp, frame, default_scale)
-
-                baked_local = mathutils.Matrix.LocRotScale(
-                    mathutils.Vector(pos_vals[:3]),
-                    mathutils.Quaternion((rot_vals[3], rot_vals[0], rot_vals[1], rot_vals[2])),
-                    mathutils.Vector(scale_vals[:3]),
+            components = _components_by_type(node)
+            pos_comp = components.get(ComponentType.Position)
+            rot_comp = components.get(ComponentType.Rotation)
+            scale_comp = components.get(ComponentType.Scale)
+
+            pos_keys = _component_arrays(pos_comp)
+            rot_keys = _component_arrays(rot_comp)
+            scale_keys = _component_arrays(scale_comp)
+            # np.unique returns the merged key frames (plus frame 0) already sorted.
+            bone_frames = np.unique(
+                np.concatenate((pos_keys[0], rot_keys[0], scale_keys[0], np.zeros(1, np.int64)))
+            )
+
+            rest_info = bone_rest.get(node.bone_name)
+            if rest_info is None:
+                rest_local_ean = ean_local.get(node.bone_name, mathutils.Matrix.Identity(4))
+                rest_info = bone_rest[node.bone_name] = _bone_rest_info(rest_local_ean)
+            rest_inv, rest_trs, default_pos, default_rot, default_scale = rest_info
+
+            if pose_bone.rotation_mode != "QUATERNION":
+                pose_bone.rotation_mode = "QUATERNION"
+
+            # Each component is interpolated for all of the bone's frames in one batch, and the
+            # baked locals are turned into rest-relative deltas with batched NumPy math.
+            pos_rows = _interp_component(*pos_keys, bone_frames, default_pos)
+            rot_rows = _interp_component(*rot_keys, bone_frames, default_rot, slerp=True)
+            scale_rows = _interp_component(*scale_keys, bone_frames, default_scale)
+            # bone_frames is sorted, so its ends are the bone's frame range.
+            first_frame, last_frame = int(bone_frames[0]), int(bone_frames[-1])
+            anim_start = first_frame if anim_start is None else min(anim_start, first_frame)
+            anim_end = last_frame if anim_end is None else max(anim_end, last_frame)
+
+            locs, quats, scales = _bake_rest_deltas(
+                rest_inv,
+                pos_rows[:, :3],
+                rot_rows[:, [3, 0, 1, 2]],
+                scale_rows[:, :3],
+                rest_trs=rest_trs,
+            )
+            for prop, values in (
+                ("location", locs),
+                ("rotation_quaternion", quats),
+                ("scale", scales),
+            ):
+                _write_channel_keys(
+                    action,
+                    pose_bone.path_from_id(prop),
+                    node.bone_name,
+                    bone_frames,
+                    values,
                 )
 
-                delta = rest_local_ean.inverted_safe() @ baked_local
-
-                loc, quat, scl = delta.decompose()
-
-                pose_bone.location = loc
-                pose_bone.keyframe_insert(data_path="location", frame=frame)
-                pose_bone.rotation_quaternion = quat
-                pose_bone.keyframe_insert(data_path="rotation_quaternion", frame=frame)
-                pose_bone.scale = scl
-                pose_bone.keyframe_insert(data_path="scale", frame=frame)
-
-        if anim_frames:
-            action.frame_range = (min(anim_frames), max(anim_frames))
+        if anim_start is not None and anim_end is not None:
+            action.frame_range = (anim_start, anim_end)
 
     return arm_obj
 
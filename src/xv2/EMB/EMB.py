@@ -4,36 +4,60 @@ import os
 import struct
 import tempfile
 from collections.abc import Callable
+from functools import lru_cache
 
 import bpy
+import numpy as np
 
 from ...utils import read_cstring
-from ...utils.binary import u16, u32
 
 DDSD_LINEARSIZE = 0x80000
 DDSD_CAPS = 0x1
 DDSD_HEIGHT = 0x2
 DDSD_WIDTH = 0x4
 DDSD_PIXELFORMAT = 0x1000
+_DDSD_REQUIRED = DDSD_LINEARSIZE | DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT
+
+# magic, header size, flags, height, width, linear size, (skip to pixel format) fourcc
+_DDS_HEADER = struct.Struct("<6I60x4s")
+# The same fields without the pixel format, for truncated entries that stop before the FourCC.
+_DDS_BASE_HEADER = struct.Struct("<6I")
+_DDS_FOURCCS = frozenset(
+    (b"DXT1", b"DXT3", b"DXT5", b"BC1 ", b"BC2 ", b"BC3 ", b"BC4 ", b"BC5 ", b"ATI2")
+)
+_DDS_PATCH = struct.Struct("<I")
+_DDS_SIGNATURE_SCAN = 4096
 
 
 def _set_colorspace(image: bpy.types.Image, name: str) -> None:
+    is_data = name in ("Non-Color", "Raw")
+    with contextlib.suppress(AttributeError, RuntimeError, ValueError, TypeError):
+        image.colorspace_settings.is_data = is_data
     with contextlib.suppress(AttributeError, RuntimeError, ValueError, TypeError):
         cs = image.colorspace_settings
-        is_data = name in ("Non-Color", "Raw")
-        cs.is_data = is_data
-        for _ in range(3):
+        if cs.name != name:
             cs.name = name
-            if cs.name == name:
-                break
-            for alt in ("Linear", "Raw", "sRGB", "Non-Color"):
-                cs.name = alt
+        if cs.name != name:
+            # Toggle through the opposite space once to force a re-evaluation, then retry.
+            with contextlib.suppress(TypeError, ValueError):
+                cs.name = "Non-Color" if name == "sRGB" else "sRGB"
+            cs.name = name
+        # Changing the name can reset the flag, so apply it again.
         cs.is_data = is_data
+        if _SESSION_DEPTH:
+            # Inside an import session the refresh runs once per image when the session ends.
+            if image not in _PENDING_UPDATES:
+                _PENDING_UPDATES.append(image)
+            return
         image.update()
         image.update_tag()
 
 
 def _force_image_colorspace(image: bpy.types.Image, name: str) -> bpy.types.Image:
+    # Reused images usually already have the right colorspace; skip the write and refresh.
+    with contextlib.suppress(AttributeError, RuntimeError, ReferenceError):
+        if image.colorspace_settings.name == name:
+            return image
     _set_colorspace(image, name)
     try:
         if image.colorspace_settings.name == name:
@@ -44,6 +68,7 @@ def _force_image_colorspace(image: bpy.types.Image, name: str) -> bpy.types.Imag
     with contextlib.suppress(AttributeError, RuntimeError, ValueError):
         dup = image.copy()
         dup.name = f"{image.name}_cs"
+        _track_created_image()
         _set_colorspace(dup, name)
         return dup
     return image
@@ -53,7 +78,8 @@ class EMBEntry:
     def __init__(self):
         self.index = 0
         self.name = ""
-        self.data: bytes = b""
+        # Zero-copy slice of the file buffer read by read_emb (keeps it alive).
+        self.data: bytes | memoryview = b""
 
 
 class EMBFile:
@@ -68,14 +94,48 @@ class EMBFile:
 
 
 EMB_SIGNATURE = 1112360227
+_EMB_SIGNATURE_BYTES = struct.pack("<I", EMB_SIGNATURE)
+# i_08, i_10, total entries, contents offset, file name table offset (from the signature)
+_EMB_HEADER = struct.Struct("<8xHHI8xII")
+# A signature not at offset 0 is only searched for in the head of the file.
+_EMB_SIGNATURE_SCAN = 4096
+
+# Parsed EMB files keyed by (abspath, mtime_ns, size); newest entries are kept last. Entries
+# pin their whole file buffer, so the cache is bounded by total file size as well as count.
+_EMB_CACHE: dict[tuple[str, int, int], EMBFile] = {}
+_EMB_CACHE_LIMIT = 32
+_EMB_CACHE_BYTE_LIMIT = 128 * 1024 * 1024
+_EMB_CACHE_BYTES = 0
+# folder -> (mtime_ns, casefolded file names) for locate_emb_files.
+_FOLDER_LISTING_CACHE: dict[str, tuple[int, frozenset[str]]] = {}
+
+# Loaded images keyed by (DDS content digest, colorspace) so identical payloads share one image.
+_DDS_IMAGE_CACHE: dict[tuple[str, str], bpy.types.Image] = {}
+
+# (emb_source_token, emb_entry_index) -> image name, rebuilt when the image count changes.
+_EMB_IMAGE_INDEX: dict[tuple[str, int], str] = {}
+_EMB_IMAGE_INDEX_SIZE = -1
+
+# Generated images waiting to be packed by flush_pending_packs().
+_PENDING_PACKS: list[bpy.types.Image] = []
+# Images whose colorspace changed inside an import session and still need a refresh.
+_PENDING_UPDATES: list[bpy.types.Image] = []
+_SESSION_DEPTH = 0
+
 
+@lru_cache(maxsize=4096)
+def _default_entry_name(index: int) -> str:
+    return f"DATA{index:03d}.dds"
 
+
+@lru_cache(maxsize=256)
 def _normalize_source_path(path: str) -> str:
     if not path:
         return ""
     return os.path.normcase(os.path.normpath(os.path.abspath(path)))
 
 
+@lru_cache(maxsize=256)
 def _source_token(path: str) -> str:
     normalized = _normalize_source_path(path)
     if not normalized:
@@ -96,15 +156,133 @@ def emb_stem_from_path(emb_path: str) -> str:
     return stem
 
 
+def _emb_alias(source_token: str, entry_index: int) -> str:
+    return f"{source_token}:{int(entry_index)}"
+
+
 def _image_matches_emb_entry(image: bpy.types.Image, source_token: str, entry_index: int) -> bool:
     try:
         image_token = str(image.get("emb_source_token", ""))
         image_index = int(image.get("emb_entry_index", -1))
-        return image_token == source_token and image_index == int(entry_index)
+        if image_token == source_token and image_index == int(entry_index):
+            return True
+        # Images shared through the DDS digest cache also answer for the entries they alias.
+        aliases = str(image.get("emb_entry_aliases", ""))
+        return bool(aliases) and _emb_alias(source_token, entry_index) in aliases.split(";")
     except (TypeError, ValueError, RuntimeError):
         return False
 
 
+def _image_is_live(image: bpy.types.Image) -> bool:
+    try:
+        return bpy.data.images.get(image.name) == image
+    except ReferenceError:
+        return False
+
+
+def _sync_emb_image_index(force: bool = False) -> None:
+    global _EMB_IMAGE_INDEX_SIZE
+    image_count = len(bpy.data.images)
+    if not force and image_count == _EMB_IMAGE_INDEX_SIZE:
+        return
+    _EMB_IMAGE_INDEX.clear()
+    # Drop digest-cache entries whose image was removed so they do not linger.
+    for key in [key for key, cached in _DDS_IMAGE_CACHE.items() if not _image_is_live(cached)]:
+        del _DDS_IMAGE_CACHE[key]
+    for image in bpy.data.images:
+        try:
+            token = str(image.get("emb_source_token", ""))
+            index = int(image.get("emb_entry_index", -1))
+            digest = str(image.get("emb_dds_digest", ""))
+            aliases = str(image.get("emb_entry_aliases", ""))
+        except (TypeError, ValueError, RuntimeError):
+            continue
+        if token and index >= 0:
+            _EMB_IMAGE_INDEX.setdefault((token, index), image.name)
+        for alias in aliases.split(";") if aliases else ():
+            alias_token, _, alias_index = alias.rpartition(":")
+            with contextlib.suppress(ValueError):
+                _EMB_IMAGE_INDEX.setdefault((alias_token, int(alias_index)), image.name)
+        if digest:
+            with contextlib.suppress(AttributeError, RuntimeError):
+                key = (digest, image.colorspace_settings.name)
+                cached = _DDS_IMAGE_CACHE.get(key)
+                if cached is None or not _image_is_live(cached):
+                    _DDS_IMAGE_CACHE[key] = image
+    _EMB_IMAGE_INDEX_SIZE = image_count
+
+
+def _find_emb_image(source_token: str, entry_index: int) -> bpy.types.Image | None:
+    _sync_emb_image_index()
+    for force in (False, True):
+        if force:
+            # The hit was stale (renamed or replaced image); rescan once and retry.
+            _sync_emb_image_index(force=True)
+        name = _EMB_IMAGE_INDEX.get((source_token, entry_index))
+        if name is None:
+            return None
+        image = bpy.data.images.get(name)
+        if image is not None and _image_matches_emb_entry(image, source_token, entry_index):
+            return image
+    return None
+
+
+def _track_created_image() -> None:
+    global _EMB_IMAGE_INDEX_SIZE
+    # Only stay in sync if this image is the sole addition since the last scan.
+    image_count = len(bpy.data.images)
+    if image_count == _EMB_IMAGE_INDEX_SIZE + 1:
+        _EMB_IMAGE_INDEX_SIZE = image_count
+
+
+def _index_emb_image(image: bpy.types.Image, source_token: str, entry_index: int) -> None:
+    _EMB_IMAGE_INDEX[(source_token, entry_index)] = image.name
+    _track_created_image()
+
+
+def _alias_emb_image(image: bpy.types.Image, source_token: str, entry_index: int) -> None:
+    # Record the extra entry on the image so lookups and rescans accept the shared image.
+    if not _image_matches_emb_entry(image, source_token, entry_index):
+        with contextlib.suppress(AttributeError, RuntimeError, TypeError):
+            aliases = str(image.get("emb_entry_aliases", ""))
+            alias = _emb_alias(source_token, entry_index)
+            image["emb_entry_aliases"] = f"{aliases};{alias}" if aliases else alias
+    _index_emb_image(image, source_token, entry_index)
+
+
+def flush_pending_packs() -> None:
+    pending = list(_PENDING_PACKS)
+    _PENDING_PACKS.clear()
+    for image in pending:
+        if not _image_is_live(image):
+            continue
+        with contextlib.suppress(RuntimeError):
+            image.pack()
+
+
+@contextlib.contextmanager
+def emb_import_session():
+    # Resync the image index once up front; refresh deferred colorspace updates and flush
+    # deferred packs when the outermost session ends. Usable as a decorator.
+    global _SESSION_DEPTH
+    if _SESSION_DEPTH == 0:
+        _sync_emb_image_index(force=True)
+    _SESSION_DEPTH += 1
+    try:
+        yield
+    finally:
+        _SESSION_DEPTH -= 1
+        if _SESSION_DEPTH == 0:
+            pending = list(_PENDING_UPDATES)
+            _PENDING_UPDATES.clear()
+            for image in pending:
+                if _image_is_live(image):
+                    with contextlib.suppress(RuntimeError):
+                        image.update()
+                        image.update_tag()
+            flush_pending_packs()
+
+
 def _build_image_name(
     emb_path: str,
     entry_index: int,
@@ -126,6 +304,7 @@ def _create_image_name(clean_name: str, source_token: str, entry_index: int) ->
     suffix = 0
     token_short = (source_token or "dup")[:6]
     while True:
+        # Probe bpy.data directly; renames and same-count swaps never reach a cached name set.
         existing = bpy.data.images.get(image_name)
         if not existing or _image_matches_emb_entry(existing, source_token, entry_index):
             return image_name
@@ -136,17 +315,56 @@ def _create_image_name(clean_name: str, source_token: str, entry_index: int) ->
             image_name = f"{clean_name}_{token_short}_{suffix}"
 
 
+def invalidate_emb_cache() -> None:
+    # Called when a new blend file is loaded; drops parsed files and image references.
+    global _EMB_CACHE_BYTES, _EMB_IMAGE_INDEX_SIZE
+    _EMB_CACHE.clear()
+    _EMB_CACHE_BYTES = 0
+    _FOLDER_LISTING_CACHE.clear()
+    _DDS_IMAGE_CACHE.clear()
+    _EMB_IMAGE_INDEX.clear()
+    _EMB_IMAGE_INDEX_SIZE = -1
+    _PENDING_PACKS.clear()
+    _PENDING_UPDATES.clear()
+
+
 def read_emb(path: str) -> EMBFile | None:
-    if not os.path.exists(path):
+    global _EMB_CACHE_BYTES
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
         return None
 
-    with open(path, "rb") as f:
-        raw = f.read()
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    emb = _EMB_CACHE.pop(key, None)
+    if emb is None:
+        with open(path, "rb") as f:
+            emb = _parse_emb(path, f.read())
+        if emb is None:
+            return None
+        if st.st_size > _EMB_CACHE_BYTE_LIMIT:
+            return emb
+        while _EMB_CACHE and (
+            len(_EMB_CACHE) >= _EMB_CACHE_LIMIT
+            or _EMB_CACHE_BYTES + st.st_size > _EMB_CACHE_BYTE_LIMIT
+        ):
+            oldest = next(iter(_EMB_CACHE))
+            _EMB_CACHE_BYTES -= oldest[2]
+            del _EMB_CACHE[oldest]
+        _EMB_CACHE_BYTES += st.st_size
+    _EMB_CACHE[key] = emb
+    return emb
+
+
+def _parse_emb(path: str, raw: bytes) -> EMBFile | None:
 
     if len(raw) < 32:
         return None
 
-    sig_pos = raw.find(struct.pack("<I", EMB_SIGNATURE))
+    if raw[:4] == _EMB_SIGNATURE_BYTES:
+        sig_pos = 0
+    else:
+        sig_pos = raw.find(_EMB_SIGNATURE_BYTES, 0, _EMB_SIGNATURE_SCAN)
     if sig_pos == -1 or sig_pos + 32 > len(raw):
         return None
 
@@ -157,45 +375,67 @@ def read_emb(path: str) -> EMBFile | None:
     emb.path = path
 
     # Header fields (to match LB parser)
-    emb.i_08 = u16(view, 8)
-    emb.i_10 = u16(view, 10)
-    total_entries = u32(view, 12)
-    contents_offset = u32(view, 24)
-    file_name_table_offset = u32(view, 28)
+    header = _EMB_HEADER.unpack_from(view)
+    emb.i_08, emb.i_10, total_entries, contents_offset, file_name_table_offset = header
     emb.use_file_names = file_name_table_offset != 0
 
+    # Entry data offsets are relative to their own table slot; truncated tables are clipped.
+    entry_count = min(total_entries, max(0, len(view) - contents_offset) // 8)
     offsets: list[int] = []
     sizes: list[int] = []
-    for i in range(total_entries):
-        entry_offset = contents_offset + i * 8
-        if entry_offset + 8 > len(view):
-            break
-        rel_offset = u32(view, entry_offset)
-        data_offset = rel_offset + entry_offset
-        data_size = u32(view, entry_offset + 4)
-        offsets.append(data_offset)
-        sizes.append(data_size)
+    if entry_count:
+        table = np.frombuffer(view, dtype="<u4", count=2 * entry_count, offset=contents_offset)
+        table = table.reshape(entry_count, 2).astype(np.int64)
+        slots = contents_offset + 8 * np.arange(entry_count, dtype=np.int64)
+        offsets = (table[:, 0] + slots).tolist()
+        sizes = table[:, 1].tolist()
 
     name_offsets: list[int] = []
-    if file_name_table_offset != 0:
-        for i in range(total_entries):
-            noff = file_name_table_offset + 4 * i
-            if noff + 4 <= len(view):
-                name_offsets.append(u32(view, noff))
-
-    for i in range(len(offsets)):
+    name_count = min(total_entries, max(0, len(view) - file_name_table_offset) // 4)
+    if file_name_table_offset != 0 and name_count:
+        name_offsets = np.frombuffer(
+            view, dtype="<u4", count=name_count, offset=file_name_table_offset
+        ).tolist()
+
+    name_count = len(name_offsets)
+    for i, (offset, size) in enumerate(zip(offsets, sizes, strict=True)):
         entry = EMBEntry()
         entry.index = i
-        if file_name_table_offset != 0 and i < len(name_offsets):
+        if i < name_count:
             entry.name = read_cstring(view, name_offsets[i])
         else:
-            entry.name = f"DATA{i:03d}.dds"
-        entry.data = view[offsets[i] : offsets[i] + sizes[i]].tobytes()
+            entry.name = _default_entry_name(i)
+        entry.data = view[offset : offset + size]
         emb.entries.append(entry)
 
     return emb
 
 
+def _load_dds_from_memory(
+    image_name: str,
+    dds_data: bytes | memoryview,
+    filepath: str,
+    expected_size: tuple[int, int],
+) -> bpy.types.Image | None:
+    # Pack the DDS bytes straight into a new image; callers fall back to a temp file when the
+    # packed data does not decode to the expected size.
+    image = None
+    try:
+        data = bytes(dds_data)
+        image = bpy.data.images.new(image_name, 1, 1)
+        image.pack(data=data, data_len=len(data))
+        image.source = "FILE"
+        image.filepath_raw = filepath
+        if all(expected_size) and tuple(image.size) != tuple(expected_size):
+            raise ValueError("packed DDS did not decode")
+        return image
+    except (AttributeError, RuntimeError, TypeError, ValueError):
+        if image is not None:
+            with contextlib.suppress(RuntimeError, ReferenceError):
+                bpy.data.images.remove(image)
+        return None
+
+
 def load_emb_image(
     entry: EMBEntry,
     emb_path: str,
@@ -213,27 +453,59 @@ def load_emb_image(
         return None
 
     emb_file = os.path.basename(emb_path)
-    entry_label = entry.name or f"DATA{entry.index:03d}.dds"
+    entry_label = entry.name or _default_entry_name(entry.index)
 
-    sig_index = entry.data.find(b"DDS ")
-    if sig_index == -1:
-        _warn(f"Texture '{entry_label}' in '{emb_file}' is not a DDS texture.")
-        return None
+    image_base = base_override or (entry.name or f"EMB_{entry.index:03d}.dds")
+    image_colorspace = "sRGB" if ".dyt" in image_base.lower() else "Non-Color"
+    normalized_source = _normalize_source_path(emb_path)
+    source_token = _source_token(normalized_source)
+    clean_name = _build_image_name(
+        emb_path=emb_path,
+        entry_index=entry.index,
+        image_base=image_base,
+    )
 
-    dds_data = entry.data[sig_index:]
+    # An image already loaded for this EMB entry skips DDS validation and hashing.
+    existing_img = _find_emb_image(source_token, entry.index)
+    if existing_img is not None:
+        # Shared images keep the name of the entry that first loaded them.
+        owned = str(existing_img.get("emb_source_token", "")) == source_token
+        target_name = _create_image_name(clean_name, source_token, entry.index)
+        if owned and existing_img.name != target_name:
+            with contextlib.suppress(RuntimeError, ValueError):
+                existing_img.name = target_name
+            _index_emb_image(existing_img, source_token, entry.index)
+        return _force_image_colorspace(existing_img, image_colorspace)
+
+    data = entry.data
+    # Entries almost always start with the DDS magic; otherwise only the head is searched.
+    if data[:4] == b"DDS ":
+        dds_data = data
+    else:
+        sig_index = bytes(data[:_DDS_SIGNATURE_SCAN]).find(b"DDS ")
+        if sig_index == -1:
+            _warn(f"Texture '{entry_label}' in '{emb_file}' is not a DDS texture.")
+            return None
+        dds_data = data[sig_index:]
 
     # DDS sanity checks and patching to keep Blender happy.
     try:
-        header_size = u32(dds_data, 4)
+        if len(dds_data) >= _DDS_HEADER.size:
+            _magic, header_size, flags, height, width, linearsize, fourcc = _DDS_HEADER.unpack_from(
+                dds_data
+            )
+        else:
+            _magic, header_size, flags, height, width, linearsize = _DDS_BASE_HEADER.unpack_from(
+                dds_data
+            )
+            fourcc = bytes(dds_data[84:88])
         if header_size != 124:
             _warn(
                 f"Texture '{entry_label}' in '{emb_file}' has an invalid DDS header "
                 "and was skipped."
             )
             return None
-        fourcc = dds_data[84:88]
-        allowed = {b"DXT1", b"DXT3", b"DXT5", b"BC1 ", b"BC2 ", b"BC3 ", b"BC4 ", b"BC5 ", b"ATI2"}
-        if fourcc and fourcc not in allowed:
+        if fourcc and fourcc not in _DDS_FOURCCS:
             fourcc_text = fourcc.decode("ascii", errors="replace").strip() or repr(fourcc)
             _warn(
                 f"Texture '{entry_label}' in '{emb_file}' uses unsupported DDS format "
@@ -241,53 +513,43 @@ def load_emb_image(
                 "Supported: DXT1, DXT3, DXT5, BC1-BC5, ATI2."
             )
             return None
-        flags = u32(dds_data, 8)
-        height = u32(dds_data, 12)
-        width = u32(dds_data, 16)
         is_bc1 = fourcc.strip() in (b"DXT1", b"BC1")
         block_size = 8 if is_bc1 else 16
-        linearsize = u32(dds_data, 20)
-        need_patch = False
         new_flags = flags
         new_linearsize = linearsize
-        if width and height:
-            calc_size = max(1, width // 4) * max(1, height // 4) * block_size
+        # Well-formed headers already carry every required flag and a linear size.
+        if width and height and ((flags & _DDSD_REQUIRED) != _DDSD_REQUIRED or not linearsize):
             if not (flags & DDSD_LINEARSIZE) or linearsize == 0:
-                new_flags |= DDSD_LINEARSIZE
-                new_linearsize = calc_size
-                need_patch = True
-            for req in (DDSD_CAPS, DDSD_HEIGHT, DDSD_WIDTH, DDSD_PIXELFORMAT):
-                if not (new_flags & req):
-                    new_flags |= req
-                    need_patch = True
+                new_linearsize = max(1, width // 4) * max(1, height // 4) * block_size
+            new_flags |= _DDSD_REQUIRED
+        need_patch = new_flags != flags or new_linearsize != linearsize
         if need_patch:
-            mutable = bytearray(dds_data)
-            struct.pack_into("<I", mutable, 8, new_flags)
-            struct.pack_into("<I", mutable, 20, new_linearsize)
-            dds_data = bytes(mutable)
+            # Splice the two patched fields in; the payload is copied once.
+            dds_data = b"".join(
+                (
+                    dds_data[:8],
+                    _DDS_PATCH.pack(new_flags),
+                    dds_data[12:20],
+                    _DDS_PATCH.pack(new_linearsize),
+                    dds_data[24:],
+                )
+            )
     except (struct.error, TypeError, ValueError, IndexError):
         _warn(
             f"Texture '{entry_label}' in '{emb_file}' could not be parsed as DDS and was skipped."
         )
         return None
 
-    image_base = base_override or (entry.name or f"EMB_{entry.index:03d}.dds")
-    image_colorspace = "sRGB" if ".dyt" in image_base.lower() else "Non-Color"
-    normalized_source = _normalize_source_path(emb_path)
-    source_token = _source_token(normalized_source)
-    clean_name = _build_image_name(
-        emb_path=emb_path,
-        entry_index=entry.index,
-        image_base=image_base,
-    )
+    digest = hashlib.blake2b(dds_data, digest_size=16).hexdigest()
+    cache_key = (digest, image_colorspace)
 
-    for existing_img in bpy.data.images:
-        if _image_matches_emb_entry(existing_img, source_token, entry.index):
-            target_name = _create_image_name(clean_name, source_token, entry.index)
-            if existing_img.name != target_name:
-                with contextlib.suppress(RuntimeError, ValueError):
-                    existing_img.name = target_name
-            return _force_image_colorspace(existing_img, image_colorspace)
+    cached = _DDS_IMAGE_CACHE.get(cache_key)
+    if cached is not None:
+        if _image_is_live(cached):
+            cached = _force_image_colorspace(cached, image_colorspace)
+            _alias_emb_image(cached, source_token, entry.index)
+            return cached
+        del _DDS_IMAGE_CACHE[cache_key]
 
     image_name = _create_image_name(clean_name, source_token, entry.index)
 
@@ -296,7 +558,7 @@ def load_emb_image(
         base_name = (
             os.path.basename(base_override)
             if base_override
-            else (os.path.basename(entry.name) if entry.name else f"DATA{entry.index:03d}.dds")
+            else (os.path.basename(entry.name) if entry.name else _default_entry_name(entry.index))
         )
         base_stem, base_ext = os.path.splitext(base_name)
         if not base_ext:
@@ -304,22 +566,28 @@ def load_emb_image(
         # Use a unique temp filename to prevent Blender from resolving a stale image datablock
         # when multiple EMBs contain DATA000-style entry names.
         temp_name = f"{source_token}_{entry.index:03d}_{base_stem}{base_ext}"
-        temp_path = os.path.join(os.path.dirname(emb_path) or tempfile.gettempdir(), temp_name)
-        with open(temp_path, "wb") as tmp:
-            tmp.write(dds_data)
-
-        image = bpy.data.images.load(temp_path, check_existing=False)
+        image_path = os.path.join(os.path.dirname(emb_path) or tempfile.gettempdir(), temp_name)
+        image = _load_dds_from_memory(image_name, dds_data, image_path, (width, height))
+        if image is None:
+            temp_path = image_path
+            with open(temp_path, "wb") as tmp:
+                tmp.write(dds_data)
+            image = bpy.data.images.load(temp_path, check_existing=False)
+            image.name = image_name
+            image.filepath = temp_path
 
-        image.name = image_name
-        image.filepath = temp_path
         image["emb_source"] = emb_path
         image["emb_source_norm"] = normalized_source
         image["emb_source_token"] = source_token
         image["emb_entry_index"] = entry.index
         image["emb_entry_name"] = entry.name
+        image["emb_dds_digest"] = digest
         image = _force_image_colorspace(image, image_colorspace)
-        with contextlib.suppress(RuntimeError):
-            image.pack()
+        _DDS_IMAGE_CACHE[cache_key] = image
+        _index_emb_image(image, source_token, entry.index)
+        if not image.packed_file:
+            with contextlib.suppress(RuntimeError):
+                image.pack()
     except (RuntimeError, OSError, ValueError, TypeError) as error:
         print("Failed to load EMB image:", entry.name, error)
         _warn(f"Texture '{entry_label}' in '{emb_file}' failed to load in Blender and was skipped.")
@@ -349,18 +617,23 @@ def _extract_dyt_lines(
     if total_needed > height:
         line_height = height // 4
 
-    src_pixels = list(image.pixels)
-    row_stride = width * 4
+    # foreach_get needs an exactly sized buffer; skip images without RGBA pixel data.
+    src_pixels = np.empty(width * height * 4, dtype=np.float32)
+    try:
+        if len(image.pixels) != src_pixels.size:
+            return results
+        image.pixels.foreach_get(src_pixels)
+    except (RuntimeError, TypeError, ValueError):
+        return results
+    # Blender pixel data is bottom-up, so flip once to index rows from the top
+    top_down = src_pixels.reshape(height, width * 4)[::-1]
 
-    def slice_rows(src_start_row: int, rows: int) -> list[float]:
-        buf: list[float] = [0.0] * (width * rows * 4)
-        for r in range(rows):
-            # Blender pixel data is bottom-up, so invert to grab from the top
-            src_row = max(0, min(height - 1, height - 1 - (src_start_row + r)))
-            src_off = src_row * row_stride
-            dst_off = r * row_stride
-            buf[dst_off : dst_off + row_stride] = src_pixels[src_off : src_off + row_stride]
-        return buf
+    def slice_rows(src_start_row: int, rows: int) -> np.ndarray:
+        if src_start_row + rows <= height:
+            return np.ascontiguousarray(top_down[src_start_row : src_start_row + rows]).ravel()
+        # A partial last block repeats the final row, as the per-row copy used to.
+        row_indices = np.minimum(np.arange(src_start_row, src_start_row + rows), height - 1)
+        return top_down[row_indices].ravel()
 
     labels = ["p", "r", "s", "d"]
     start_line = max(0, block_index) * 4
@@ -387,9 +660,8 @@ def _extract_dyt_lines(
         if existing:
             try:
                 valid_size = existing.size[0] == width and existing.size[1] == line_height
-                has_pixels = (
-                    bool(existing.has_data) and len(existing.pixels) >= width * line_height * 4
-                )
+                # Size is checked above, so the channel count decides the pixel count.
+                has_pixels = bool(existing.has_data) and existing.channels >= 4
                 same_source = (
                     not source_token or str(existing.get("emb_source_token", "")) == source_token
                 )
@@ -407,16 +679,41 @@ def _extract_dyt_lines(
             alpha=True,
             float_buffer=True,
         )
-        new_img.pixels = buf
+        _track_created_image()
+        new_img.pixels.foreach_set(buf)
         if source_token:
             new_img["emb_source_token"] = source_token
-        new_img.pack()
         new_img = _force_image_colorspace(new_img, "sRGB")
+        if _SESSION_DEPTH:
+            _PENDING_PACKS.append(new_img)
+        else:
+            # Outside an import session nothing would flush the queue, so pack right away.
+            with contextlib.suppress(RuntimeError):
+                new_img.pack()
         results[label] = new_img
 
     return results
 
 
+def _folder_listing(folder: str) -> tuple[frozenset[str], bool]:
+    # One directory listing instead of a stat per candidate, reused until the folder's mtime
+    # changes. Returns the casefolded names and whether they came from a fresh scan.
+    try:
+        mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return frozenset(), True
+    cached = _FOLDER_LISTING_CACHE.get(folder)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], False
+    try:
+        with os.scandir(folder) as it:
+            present = frozenset(e.name.casefold() for e in it if e.is_file())
+    except OSError:
+        return frozenset(), True
+    _FOLDER_LISTING_CACHE[folder] = (mtime, present)
+    return present, True
+
+
 def locate_emb_files(path: str) -> tuple[EMBFile | None, EMBFile | None]:
     folder = os.path.dirname(path)
     base = os.path.basename(path)
@@ -436,19 +733,27 @@ def locate_emb_files(path: str) -> tuple[EMBFile | None, EMBFile | None]:
         (True, os.path.join(folder, f"{char_code}_000.dyt.emb")),
     ]
 
+    present, fresh = _folder_listing(folder or os.curdir)
+
     main_emb = None
     dyt_emb = None
     for is_dyt, candidate in candidates:
-        if not os.path.exists(candidate):
+        # Skip missing files and candidates whose slot is already filled.
+        if (dyt_emb if is_dyt else main_emb) is not None:
+            continue
+        # Names are casefolded so case-insensitive filesystems (macOS) still match; read_emb
+        # rejects a case-only match on case-sensitive ones. A reused listing can be stale on
+        # coarse-mtime or network filesystems, so a miss there falls back to a stat.
+        if os.path.basename(candidate).casefold() not in present and (
+            fresh or not os.path.exists(candidate)
+        ):
             continue
         emb_file = read_emb(candidate)
         if emb_file is None:
             continue
         if is_dyt:
-            if dyt_emb is None:
-                dyt_emb = emb_file
+            dyt_emb = emb_file
         else:
-            if main_emb is None:
-                main_emb = emb_file
+            main_emb = emb_file
 
     return main_emb, dyt_emb
@@ -1,8 +1,13 @@
 from .EMB import (
     EMBEntry,
     EMBFile,
+    _default_entry_name,
     _extract_dyt_lines,
+    _normalize_source_path,
+    emb_import_session,
     emb_stem_from_path,
+    flush_pending_packs,
+    invalidate_emb_cache,
     load_emb_image,
     locate_emb_files,
     read_emb,
@@ -13,7 +18,12 @@ __all__ = [
     "EMBFile",
     "emb_stem_from_path",
     "read_emb",
+    "invalidate_emb_cache",
+    "flush_pending_packs",
+    "emb_import_session",
     "load_emb_image",
     "locate_emb_files",
     "_extract_dyt_lines",
+    "_default_entry_name",
+    "_normalize_source_path",
 ]
@@ -1,6 +1,8 @@
 import struct
 
-from ...utils import half_to_float, read_cstring
+import numpy as np
+
+from ...utils import read_cstring
 from ...utils.binary import f32, u16, u32
 
 
@@ -201,96 +203,89 @@ def set_sampler_custom_properties(target, samplers: list[EMD_TextureSamplerDef])
     target["emd_texture_sampler_defs"] = sampler_dict
 
 
-def read_vertices(
-    flags: int, data: bytes, offset: int, vertex_count: int, vertex_size: int
-) -> list[EMD_Vertex]:
-    vertices: list[EMD_Vertex] = []
+def _vertex_dtype(flags: int) -> np.dtype:
+    # Packed per-vertex layout in file order; compressed normals/tangents/weights carry a
+    # fourth (padding) half.
     is_compressed = bool(flags & VERTEX_COMPRESSED)
-    vertex_pointer = offset
-
-    for _ in range(vertex_count):
-        vertex = EMD_Vertex()
-        bytes_read = 0
-
-        if flags & VERTEX_POSITION:
-            vertex.pos = struct.unpack_from("<3f", data, vertex_pointer + bytes_read)
-            bytes_read += get_vertex_size_from_flags(VERTEX_POSITION)
-
-        if flags & VERTEX_NORMAL:
-            if is_compressed:
-                nx = half_to_float(u16(data, vertex_pointer + bytes_read + 0))
-                ny = half_to_float(u16(data, vertex_pointer + bytes_read + 2))
-                nz = half_to_float(u16(data, vertex_pointer + bytes_read + 4))
-                vertex.normal = (nx, ny, nz)
-                bytes_read += get_vertex_size_from_flags(VERTEX_NORMAL | VERTEX_COMPRESSED)
-            else:
-                vertex.normal = struct.unpack_from("<3f", data, vertex_pointer + bytes_read)
-                bytes_read += get_vertex_size_from_flags(VERTEX_NORMAL)
-
-        if flags & VERTEX_TEXUV:
-            if is_compressed:
-                u = half_to_float(u16(data, vertex_pointer + bytes_read + 0))
-                v = half_to_float(u16(data, vertex_pointer + bytes_read + 2))
-                vertex.uv = (u, 1.0 - v)
-                bytes_read += get_vertex_size_from_flags(VERTEX_TEXUV | VERTEX_COMPRESSED)
-            else:
-                u, v = struct.unpack_from("<2f", data, vertex_pointer + bytes_read)
-                vertex.uv = (u, 1.0 - v)
-                bytes_read += get_vertex_size_from_flags(VERTEX_TEXUV)
-
-        if flags & VERTEX_TEX2UV:
-            if is_compressed:
-                u2 = half_to_float(u16(data, vertex_pointer + bytes_read + 0))
-                v2 = half_to_float(u16(data, vertex_pointer + bytes_read + 2))
-                vertex.uv2 = (u2, 1.0 - v2)
-                bytes_read += get_vertex_size_from_flags(VERTEX_TEX2UV | VERTEX_COMPRESSED)
-            else:
-                u2, v2 = struct.unpack_from("<2f", data, vertex_pointer + bytes_read)
-                vertex.uv2 = (u2, 1.0 - v2)
-                bytes_read += get_vertex_size_from_flags(VERTEX_TEX2UV)
-
-        if flags & VERTEX_TANGENT:
-            if is_compressed:
-                tx = half_to_float(u16(data, vertex_pointer + bytes_read + 0))
-                ty = half_to_float(u16(data, vertex_pointer + bytes_read + 2))
-                tz = half_to_float(u16(data, vertex_pointer + bytes_read + 4))
-                vertex.tangent = (tx, ty, tz)
-                bytes_read += get_vertex_size_from_flags(VERTEX_TANGENT | VERTEX_COMPRESSED)
-            else:
-                tx, ty, tz = struct.unpack_from("<3f", data, vertex_pointer + bytes_read)
-                vertex.tangent = (tx, ty, tz)
-                bytes_read += get_vertex_size_from_flags(VERTEX_TANGENT)
-
-        if flags & VERTEX_COLOR:
-            r, g, b, a = struct.unpack_from("<4B", data, vertex_pointer + bytes_read)
-            vertex.color = (r / 255.0, g / 255.0, b / 255.0, a / 255.0)
-            bytes_read += get_vertex_size_from_flags(VERTEX_COLOR)
-
-        if flags & VERTEX_BLENDWEIGHT:
-            bone_id0, bone_id1, bone_id2, bone_id3 = struct.unpack_from(
-                "<4B", data, vertex_pointer + bytes_read
-            )
-            vertex.bone_ids = [bone_id0, bone_id1, bone_id2, bone_id3]
-
-            if is_compressed:
-                weight0 = half_to_float(u16(data, vertex_pointer + bytes_read + 4))
-                weight1 = half_to_float(u16(data, vertex_pointer + bytes_read + 6))
-                weight2 = half_to_float(u16(data, vertex_pointer + bytes_read + 8))
-                bytes_read += get_vertex_size_from_flags(VERTEX_BLENDWEIGHT | VERTEX_COMPRESSED)
-            else:
-                weight0, weight1, weight2 = struct.unpack_from(
-                    "<3f", data, vertex_pointer + bytes_read + 4
-                )
-                bytes_read += get_vertex_size_from_flags(VERTEX_BLENDWEIGHT)
+    real = "<f2" if is_compressed else "<f4"
+    vec3 = 4 if is_compressed else 3
+    fields: list[tuple[str, str, tuple[int]]] = []
+    if flags & VERTEX_POSITION:
+        fields.append(("pos", "<f4", (3,)))
+    if flags & VERTEX_NORMAL:
+        fields.append(("normal", real, (vec3,)))
+    if flags & VERTEX_TEXUV:
+        fields.append(("uv", real, (2,)))
+    if flags & VERTEX_TEX2UV:
+        fields.append(("uv2", real, (2,)))
+    if flags & VERTEX_TANGENT:
+        fields.append(("tangent", real, (vec3,)))
+    if flags & VERTEX_COLOR:
+        fields.append(("color", "u1", (4,)))
+    if flags & VERTEX_BLENDWEIGHT:
+        fields.append(("bone_ids", "u1", (4,)))
+        fields.append(("bone_weights", real, (vec3,)))
+    return np.dtype(fields)
+
 
-            weight3 = 1.0 - (weight0 + weight1 + weight2)
-            vertex.bone_weights = [weight0, weight1, weight2, weight3]
+def _flipped_uvs(uv: np.ndarray) -> list[tuple[float, float]]:
+    uv = uv.astype(np.float64)
+    uv[:, 1] = 1.0 - uv[:, 1]
+    return list(map(tuple, uv.tolist()))
 
-        if bytes_read != vertex_size:
-            raise ValueError(f"VertexSize mismatch: expected {vertex_size}, got {bytes_read}")
 
-        vertex_pointer += vertex_size
-        vertices.append(vertex)
+def read_vertices(
+    flags: int, data: bytes, offset: int, vertex_count: int, vertex_size: int
+) -> list[EMD_Vertex]:
+    if vertex_count <= 0:
+        return []
+
+    dtype = _vertex_dtype(flags)
+    if dtype.itemsize != vertex_size:
+        raise ValueError(f"VertexSize mismatch: expected {vertex_size}, got {dtype.itemsize}")
+
+    # Keep the struct.error the per-vertex unpack_from reader raised on truncated buffers.
+    required = vertex_count * vertex_size
+    if offset < 0 or offset + required > len(data):
+        raise struct.error(
+            f"unpack_from requires a buffer of at least {offset + required} bytes "
+            f"for unpacking {required} bytes at offset {offset} (actual buffer size is {len(data)})"
+        )
+
+    # Decode every attribute as a column, then hand out per-vertex Python values.
+    packed = np.frombuffer(data, dtype=dtype, count=vertex_count, offset=offset)
+    vertices = [EMD_Vertex() for _ in range(vertex_count)]
+    names = dtype.names or ()
+
+    if "pos" in names:
+        for vertex, pos in zip(vertices, map(tuple, packed["pos"].tolist()), strict=True):
+            vertex.pos = pos
+    if "normal" in names:
+        normals = map(tuple, packed["normal"][:, :3].tolist())
+        for vertex, normal in zip(vertices, normals, strict=True):
+            vertex.normal = normal
+    if "uv" in names:
+        for vertex, uv in zip(vertices, _flipped_uvs(packed["uv"]), strict=True):
+            vertex.uv = uv
+    if "uv2" in names:
+        for vertex, uv2 in zip(vertices, _flipped_uvs(packed["uv2"]), strict=True):
+            vertex.uv2 = uv2
+    if "tangent" in names:
+        tangents = map(tuple, packed["tangent"][:, :3].tolist())
+        for vertex, tangent in zip(vertices, tangents, strict=True):
+            vertex.tangent = tangent
+    if "color" in names:
+        colors = map(tuple, (packed["color"] / 255.0).tolist())
+        for vertex, color in zip(vertices, colors, strict=True):
+            vertex.color = color
+    if "bone_ids" in names:
+        weights = packed["bone_weights"][:, :3].astype(np.float64)
+        last = 1.0 - (weights[:, 0] + weights[:, 1] + weights[:, 2])
+        all_weights = np.column_stack((weights, last)).tolist()
+        bone_ids = packed["bone_ids"].tolist()
+        for vertex, ids, vertex_weights in zip(vertices, bone_ids, all_weights, strict=True):
+            vertex.bone_ids = ids
+            vertex.bone_weights = vertex_weights
 
     return vertices
 
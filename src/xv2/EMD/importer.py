@@ -11,7 +11,10 @@ import mathutils
 from ...ui import sampler_defs_to_collection
 from ...utils import remove_unused_vertex_groups
 from ..EMB import (
+    _default_entry_name,
     _extract_dyt_lines,
+    _normalize_source_path,
+    emb_import_session,
     emb_stem_from_path,
     load_emb_image,
     locate_emb_files,
@@ -297,6 +300,27 @@ def create_material(
     )
 
 
+# (normalized DYT EMB path, entry index, block index) -> (source token, line image names by label).
+_DYT_LINE_CACHE: dict[tuple[str, int, int], tuple[str, dict[str, str]]] = {}
+
+
+def invalidate_dyt_line_cache() -> None:
+    _DYT_LINE_CACHE.clear()
+
+
+def _cached_dyt_lines(key: tuple[str, int, int]) -> dict[str, bpy.types.Image] | None:
+    cached = _DYT_LINE_CACHE.get(key)
+    if not cached or not cached[1]:
+        return None
+    source_token, names = cached
+    lines = {label: bpy.data.images.get(name) for label, name in names.items()}
+    for image in lines.values():
+        if image is None or str(image.get("emb_source_token", "")) != source_token:
+            del _DYT_LINE_CACHE[key]
+            return None
+    return lines
+
+
 def _image_from_sampler(
     sampler_defs,
     sampler_index: int,
@@ -315,7 +339,7 @@ def _image_from_sampler(
     if entry_name.endswith(".dyt") or ".dyt." in entry_name:
         if warn:
             warn(
-                f"Skipping DYT source texture '{entry.name or f'DATA{entry.index:03d}.dds'}' "
+                f"Skipping DYT source texture '{entry.name or _default_entry_name(entry.index)}' "
                 f"from '{os.path.basename(emb_main.path)}'."
             )
         return None
@@ -344,7 +368,8 @@ def _apply_shader_material(
         with contextlib.suppress(RuntimeError):
             bpy.data.images.remove(image, do_unlink=True)
 
-    nodes = mat.node_tree.nodes
+    # Snapshot the template's nodes once; every lookup below is by name.
+    nodes = {node.name: node for node in mat.node_tree.nodes}
 
     # Apply sampler textures
     emb_node = nodes.get("XV2_EMB_SAMPLER")
@@ -422,21 +447,34 @@ def _apply_shader_material(
             dyt_entry = dyt_entries[selected_idx]
 
         if dyt_entry is not None:
-            base_name = os.path.splitext(dyt_entry.name or f"DATA{dyt_entry.index:03d}.dds")[0]
-            dyt_image = load_emb_image(
-                dyt_entry,
-                emb_dyt.path,
-                base_override=f"{base_name}.dyt.dds",
-                warn=warn,
-            )
-            if dyt_image:
-                block_idx = max(0, mat_scale)
-                lines = _extract_dyt_lines(
-                    dyt_image,
-                    f"{emb_stem_from_path(emb_dyt.path)}_toon",
-                    block_index=block_idx,
-                    source_token=str(dyt_image.get("emb_source_token", "")),
+            block_idx = max(0, mat_scale)
+            dyt_key = (_normalize_source_path(emb_dyt.path), dyt_entry.index, block_idx)
+            lines = _cached_dyt_lines(dyt_key)
+            if lines is None:
+                base_name = os.path.splitext(
+                    dyt_entry.name or _default_entry_name(dyt_entry.index)
+                )[0]
+                dyt_image = load_emb_image(
+                    dyt_entry,
+                    emb_dyt.path,
+                    base_override=f"{base_name}.dyt.dds",
+                    warn=warn,
                 )
+                if dyt_image:
+                    source_token = str(dyt_image.get("emb_source_token", ""))
+                    lines = _extract_dyt_lines(
+                        dyt_image,
+                        f"{emb_stem_from_path(emb_dyt.path)}_toon",
+                        block_index=block_idx,
+                        source_token=source_token,
+                    )
+                    _DYT_LINE_CACHE[dyt_key] = (
+                        source_token,
+                        {label: img.name for label, img in lines.items()},
+                    )
+                    # Keep only extracted DYT line images in the blend file.
+                    _remove_image(dyt_image)
+            if lines:
                 primary = lines.get("p") or next(iter(lines.values()), None)
                 rim = lines.get("r")
                 spec = lines.get("s")
@@ -453,9 +491,6 @@ def _apply_shader_material(
                     if node and img_obj:
                         _configure_image(node, img_obj, is_dyt=True)
 
-                # Keep only extracted DYT line images in the blend file.
-                _remove_image(dyt_image)
-
     def _apply_params_to_group(group_name: str) -> None:
         group_node = nodes.get(group_name)
         if not (group_node and hasattr(group_node, "inputs") and emm_info):
@@ -501,6 +536,7 @@ def _validate_face_indices(
     return face_indices
 
 
+@emb_import_session()
 def import_emd(
     path: str,
     esk_override: str = "",